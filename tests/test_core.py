@@ -1,7 +1,10 @@
 import datetime as dt
+import json
+import os
 import sys
 import unittest.mock as mock
 from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
@@ -13,14 +16,22 @@ import xarray as xr
 
 from varunayan.core import (
     ProcessingParams,
+    _chunk_plan,
+    _drop_duplicate_rows,
+    _iter_chunks,
+    _load_geojson_cached,
+    _to_float32,
     adjust_sum_variables,
     aggregate_and_save,
     cleanup_temp_files,
     download_with_retry,
+    draw_geojson_ascii,
     era5ify_bbox,
     era5ify_geojson,
+    era5ify_many,
     era5ify_point,
     load_and_validate_geojson,
+    load_json_with_encoding,
     parse_date,
     print_bounding_box,
     print_processing_header,
@@ -28,6 +39,8 @@ from varunayan.core import (
     process_era5,
     process_era5_data,
     process_time_chunks,
+    save_results,
+    set_verbosity,
     validate_inputs,
 )
 
@@ -192,6 +205,10 @@ def test_download_with_retry_failure(
         download_with_retry(failing_download, basic_params)
 
     assert mock_sleep.call_count > 0
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert len(delays) == 5
+    for delay, cap in zip(delays, [10, 20, 40, 80, 120]):
+        assert cap / 2 <= delay <= cap
 
 
 @patch("varunayan.core.process_era5_data")
@@ -272,6 +289,70 @@ def test_process_time_chunks_with_chunking(
 
     result = process_time_chunks(chunk_params, mock_down_func, mock_proc_func)
     assert isinstance(result, pd.DataFrame)
+    assert mock_process.call_count == 4
+
+
+@patch("time.sleep")
+def test_process_time_chunks_sequential_does_not_wait(
+    mock_sleep: MagicMock, basic_params: ProcessingParams
+):
+    chunk_params = ProcessingParams(
+        request_id=basic_params.request_id,
+        variables=basic_params.variables,
+        start_date=dt.datetime(2020, 1, 1),
+        end_date=dt.datetime(2020, 2, 15),  # 4 chunks of up to 14 days
+    )
+
+    def mock_proc_func(
+        params: ProcessingParams,
+        chunk_num: Optional[int] = None,
+        total_chunks: Optional[int] = None,
+    ):
+        # Recent chunks carry the preliminary ERA5T experiment version
+        expver = "0005" if chunk_num and chunk_num > 2 else "0001"
+        return pd.DataFrame({"chunk": [chunk_num], "expver": pd.Categorical([expver])})
+
+    result = process_time_chunks(chunk_params, MagicMock(), mock_proc_func)
+
+    assert result is not None
+    assert result["chunk"].tolist() == [1, 2, 3, 4]
+    # Chunks with different expver categories still concatenate as categorical
+    assert isinstance(result["expver"].dtype, pd.CategoricalDtype)
+    assert result["expver"].tolist() == ["0001", "0001", "0005", "0005"]
+    mock_sleep.assert_not_called()
+
+
+@patch("time.sleep")
+def test_process_time_chunks_concurrent(
+    mock_sleep: MagicMock, basic_params: ProcessingParams
+):
+    chunk_params = ProcessingParams(
+        request_id=basic_params.request_id,
+        variables=basic_params.variables,
+        start_date=dt.datetime(2020, 1, 1),
+        end_date=dt.datetime(2020, 2, 15),  # 4 chunks of up to 14 days
+        max_workers=3,
+    )
+
+    def mock_proc_func(
+        params: ProcessingParams,
+        chunk_num: Optional[int] = None,
+        total_chunks: Optional[int] = None,
+    ):
+        if chunk_num == 2:
+            raise RuntimeError("chunk failed")
+        return pd.DataFrame({"chunk": [chunk_num], "start": [params.start_date]})
+
+    result = process_time_chunks(chunk_params, MagicMock(), mock_proc_func)
+
+    assert result is not None
+    assert result["chunk"].tolist() == [1, 3, 4]
+    assert result["start"].tolist() == [
+        dt.datetime(2020, 1, 1),
+        dt.datetime(2020, 1, 29),
+        dt.datetime(2020, 2, 12),
+    ]
+    assert mock_sleep.call_count == 3
 
 
 @patch("time.sleep")
@@ -311,6 +392,64 @@ def test_process_time_chunks_with_chunking_mo_pr(
     assert isinstance(result, pd.DataFrame)
 
 
+def test_chunk_plan(basic_params: ProcessingParams):
+    assert _chunk_plan(basic_params) == (False, 2, 14)
+
+    # 10 variables on 37 levels is 8880 hourly fields per day
+    basic_params.variables = [f"var{i}" for i in range(10)]
+    basic_params.pressure_levels = [str(level) for level in range(37)]
+    assert _chunk_plan(basic_params) == (False, 2, 13)
+
+    basic_params.variables = [f"var{i}" for i in range(1000)]
+    assert _chunk_plan(basic_params)[2] == 1
+
+    basic_params.variables = ["2m_temperature"]
+    basic_params.pressure_levels = None
+    basic_params.frequency = "monthly"
+    basic_params.end_date = dt.datetime(2021, 3, 31)
+    assert _chunk_plan(basic_params) == (True, 15, 100)
+
+
+def test_iter_chunks():
+    daily = list(
+        _iter_chunks(dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 20), False, 14)
+    )
+    assert daily == [
+        (dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 14)),
+        (dt.datetime(2020, 1, 15), dt.datetime(2020, 1, 20)),
+    ]
+
+    monthly = list(
+        _iter_chunks(dt.datetime(2019, 11, 1), dt.datetime(2020, 5, 10), True, 3)
+    )
+    assert monthly == [
+        (dt.datetime(2019, 11, 1), dt.datetime(2020, 1, 31)),
+        (dt.datetime(2020, 2, 1), dt.datetime(2020, 4, 30)),
+        (dt.datetime(2020, 5, 1), dt.datetime(2020, 5, 10)),
+    ]
+
+    # Month ends follow the calendar, including leap years
+    monthly = list(
+        _iter_chunks(dt.datetime(2019, 12, 31), dt.datetime(2020, 12, 31), True, 2)
+    )
+    assert [end for _, end in monthly] == [
+        dt.datetime(2020, 1, 31),
+        dt.datetime(2020, 3, 31),
+        dt.datetime(2020, 5, 31),
+        dt.datetime(2020, 7, 31),
+        dt.datetime(2020, 9, 30),
+        dt.datetime(2020, 11, 30),
+        dt.datetime(2020, 12, 31),
+    ]
+    assert monthly[1][0] == dt.datetime(2020, 2, 1)
+
+    # A range that fits in one chunk comes back whole
+    single = list(
+        _iter_chunks(dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 5), False, 14)
+    )
+    assert single == [(dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 5))]
+
+
 @patch("varunayan.core.save_results")
 @patch("varunayan.core.aggregate_by_frequency")
 def test_aggregate_and_save(
@@ -356,6 +495,92 @@ def test_era5ify_geojson(mock_process: MagicMock, sample_geojson_file: str):
     mock_process.assert_called_once()
 
 
+@patch("varunayan.util.geojson_utils.tempfile.mkstemp")
+@patch("varunayan.core.process_era5")
+def test_era5ify_geojson_passes_data_in_memory(
+    mock_process: MagicMock,
+    mock_tempfile: MagicMock,
+    sample_geojson: Dict[str, Any],
+    sample_geojson_file: str,
+):
+    mock_process.return_value = pd.DataFrame({"test": [1, 2, 3]})
+
+    era5ify_geojson(
+        request_id="test",
+        variables=["t2m"],
+        start_date="2020-01-01",
+        end_date="2020-01-02",
+        json_file=sample_geojson_file,
+    )
+
+    params = mock_process.call_args[0][0]
+    assert params.geojson_data == sample_geojson
+    assert params.geojson_file == sample_geojson_file
+    mock_tempfile.assert_not_called()
+
+
+@patch("varunayan.core.process_era5")
+def test_era5ify_geojson_reuses_parsed_file(
+    mock_process: MagicMock, sample_geojson_file: str
+):
+    mock_process.return_value = pd.DataFrame({"test": [1, 2, 3]})
+    _load_geojson_cached.cache_clear()
+
+    with patch(
+        "varunayan.core.load_json_with_encoding", wraps=load_json_with_encoding
+    ) as mock_load:
+        for _ in range(2):
+            era5ify_geojson(
+                request_id="test",
+                variables=["t2m"],
+                start_date="2020-01-01",
+                end_date="2020-01-02",
+                json_file=sample_geojson_file,
+            )
+
+    mock_load.assert_called_once_with(sample_geojson_file)
+    assert mock_process.call_count == 2
+
+
+@patch("varunayan.core.process_era5")
+def test_era5ify_geojson_cached_file_is_not_shared(
+    mock_process: MagicMock,
+    sample_geojson: Dict[str, Any],
+    temp_dir: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _load_geojson_cached.cache_clear()
+    seen: List[Dict[str, Any]] = []
+
+    def mutate(params: ProcessingParams, save_raw: bool) -> pd.DataFrame:
+        seen.append(json.loads(json.dumps(params.geojson_data)))
+        params.geojson_data["features"].clear()  # type: ignore[index]
+        return pd.DataFrame({"test": [1]})
+
+    mock_process.side_effect = mutate
+
+    # The same relative path names a different file in each directory
+    for name, shift in [("a", 0.0), ("b", 1.0)]:
+        os.makedirs(os.path.join(temp_dir, name))
+        geojson = json.loads(json.dumps(sample_geojson))
+        geojson["features"][0]["properties"] = {"shift": shift}
+        with open(os.path.join(temp_dir, name, "area.geojson"), "w") as f:
+            json.dump(geojson, f)
+
+    for name in ["a", "a", "b"]:
+        monkeypatch.chdir(os.path.join(temp_dir, name))
+        era5ify_geojson(
+            request_id="test",
+            variables=["t2m"],
+            start_date="2020-01-01",
+            end_date="2020-01-02",
+            json_file="area.geojson",
+        )
+
+    # Clearing the features on the first call did not reach the cache
+    assert [d["features"][0]["properties"]["shift"] for d in seen] == [0.0, 0.0, 1.0]
+
+
 @patch("varunayan.core.process_era5")
 def test_era5ify_bbox(mock_process: MagicMock):
     mock_process.return_value = pd.DataFrame({"test": [1, 2, 3]})
@@ -392,6 +617,70 @@ def test_era5ify_point(mock_process: MagicMock):
     mock_process.assert_called_once()
 
 
+@patch("varunayan.util.geojson_utils.tempfile.mkstemp")
+@patch("varunayan.core.process_era5")
+def test_era5ify_point_passes_data_in_memory(
+    mock_process: MagicMock, mock_tempfile: MagicMock
+):
+    mock_process.return_value = pd.DataFrame({"test": [1, 2, 3]})
+
+    era5ify_point(
+        request_id="test_point_in_memory",
+        variables=["t2m"],
+        start_date="2020-01-01",
+        end_date="2020-01-02",
+        latitude=37.75,
+        longitude=-122.25,
+    )
+
+    params = mock_process.call_args[0][0]
+    assert params.geojson_file is None
+    assert params.geojson_data["features"][0]["properties"]["center_lat"] == 37.75
+    assert params.resolution == 0.1
+    mock_tempfile.assert_not_called()
+
+
+@patch("varunayan.core.ProcessPoolExecutor", ThreadPoolExecutor)
+@patch("varunayan.core.era5ify_bbox")
+@patch("varunayan.core.era5ify_point")
+@patch("varunayan.core.era5ify_geojson")
+def test_era5ify_many(
+    mock_geojson: MagicMock, mock_point: MagicMock, mock_bbox: MagicMock
+):
+    mock_geojson.return_value = pd.DataFrame({"kind": ["geojson"]})
+    mock_point.return_value = pd.DataFrame({"kind": ["point"]})
+    mock_bbox.return_value = pd.DataFrame({"kind": ["bbox"]})
+    common = {"variables": ["t2m"], "start_date": "2020-1-1", "end_date": "2020-1-2"}
+
+    results = era5ify_many(
+        [
+            {"request_id": "req_b", "north": 1, "south": 0, "east": 1, "west": 0},
+            {"request_id": "req_g", "json_file": "area.geojson", **common},
+            {"request_id": "req_p", "latitude": 10.0, "longitude": 20.0, **common},
+        ],
+        max_workers=2,
+    )
+
+    assert [df["kind"][0] for df in results] == ["bbox", "geojson", "point"]
+    mock_geojson.assert_called_once_with(
+        request_id="req_g", json_file="area.geojson", **common
+    )
+
+    with pytest.raises(ValueError, match="clashes"):
+        era5ify_many([{"request_id": "run"}, {"request_id": "run"}])
+    with pytest.raises(ValueError, match="clashes"):
+        era5ify_many([{"request_id": "run"}, {"request_id": "run_chunk2"}])
+
+
+@patch("varunayan.core.ProcessPoolExecutor")
+def test_era5ify_many_default_workers(mock_executor: MagicMock):
+    mock_executor.return_value.__enter__.return_value.map.return_value = []
+
+    # Ids that merely contain one another are distinct requests
+    era5ify_many([{"request_id": "run"}, {"request_id": "run_2"}, {"request_id": "x"}])
+    mock_executor.assert_called_once_with(max_workers=2)
+
+
 def test_adjust_sum_variables_monthly():
     """Test monthly adjustment of sum variables"""
     # Create test DataFrame
@@ -577,40 +866,21 @@ def test_validate_inputs_pressure_levels():
     validate_inputs(params)
 
 
-@patch("os.path.exists", return_value=True)
-@patch("os.remove")
-@patch("shutil.rmtree")
-@patch("glob.glob")
-def test_cleanup_temp_files(
-    mock_glob: MagicMock,
-    mock_rmtree: MagicMock,
-    mock_remove: MagicMock,
-    mock_exists: MagicMock,
-):
+def test_cleanup_temp_files(temp_dir: str):
     """Test cleanup of temporary files"""
+    tmp = Path(temp_dir)
+    owned = ["test123.zip", "test123_chunk2.nc"]
+    others = ["test1234.zip", "test123_2.zip", "other.nc"]
+    for name in [*owned, *others]:
+        (tmp / name).touch()
+    (tmp / "test123_chunk1").mkdir()
+    (tmp / "test123_2").mkdir()
 
-    # Mock glob to return files for both patterns
-    def mock_glob_side_effect(pattern: str) -> Optional[List[str]]:
-        if "*test123*.zip" in pattern:
-            return ["/tmp/test123.zip"]
-        elif "*test123*.nc" in pattern:
-            return ["/tmp/test123.nc"]
-        else:
-            return []
-
-    mock_glob.side_effect = mock_glob_side_effect
+    with patch("tempfile.gettempdir", return_value=temp_dir):
+        cleanup_temp_files("test123")
 
-    cleanup_temp_files("test123", "/tmp/test123.json")
-
-    # Check that remove was called for the temp_geojson_file
-    mock_remove.assert_any_call("/tmp/test123.json")
-    # Check that remove was called for the glob files
-    mock_remove.assert_any_call("/tmp/test123.zip")
-    mock_remove.assert_any_call("/tmp/test123.nc")
-
-    # The function calls glob twice (once for *.zip, once for *.nc)
-    # So we expect 3 remove calls: temp_geojson_file + zip file + nc file
-    assert mock_remove.call_count == 3
+    # Only this request's downloads and extraction directories are removed
+    assert sorted(p.name for p in tmp.iterdir()) == sorted([*others, "test123_2"])
 
 
 @patch("varunayan.core.aggregate_and_save")
@@ -653,6 +923,49 @@ def test_process_era5(
     mock_footer.assert_called_once()
 
 
+@patch("varunayan.core.draw_geojson_ascii")
+@patch("varunayan.core.aggregate_and_save")
+@patch("varunayan.core.print_processing_footer")
+@patch("varunayan.core.validate_inputs")
+@patch("varunayan.core.process_time_chunks")
+def test_process_era5_skips_mini_map_when_quiet(
+    mock_process: MagicMock,
+    mock_validate: MagicMock,
+    mock_footer: MagicMock,
+    mock_agg: MagicMock,
+    mock_draw: MagicMock,
+    sample_geojson: Dict[str, Any],
+):
+    mock_agg.return_value = pd.DataFrame({"test": [1, 2, 3]})
+    params = ProcessingParams(
+        request_id="test",
+        variables=["t2m"],
+        start_date=dt.datetime(2020, 1, 1),
+        end_date=dt.datetime(2020, 1, 2),
+        geojson_data=sample_geojson,
+    )
+
+    set_verbosity(0)
+    process_era5(params, True)
+    mock_draw.assert_not_called()
+
+    set_verbosity(1)
+    process_era5(params, True)
+    mock_draw.assert_called_once_with(sample_geojson)
+    set_verbosity(2)  # module default
+
+
+@patch("varunayan.core.logger")
+def test_draw_geojson_ascii(mock_logger: MagicMock, sample_geojson: Dict[str, Any]):
+    """Test that the mini map spans the polygon's bounds"""
+    draw_geojson_ascii(sample_geojson)
+
+    mock_logger.warning.assert_not_called()
+    header = mock_logger.info.call_args_list[0][0][0]
+    assert "-122.50° to -122.00°" in header
+    assert "37.50° to 38.00°" in header
+
+
 @patch("varunayan.core.process_era5")
 def test_era5ify_point_edge_cases(mock_process: MagicMock):
     """Test era5ify_point with edge case coordinates"""
@@ -739,6 +1052,7 @@ def test_process_era5_data_single_level_success(
             "valid_time": pd.date_range("2020-01-01", periods=24, freq="h"),
             "latitude": [37.5, 38.0],
             "longitude": [-122.5, -122.0],
+            "expver": ("valid_time", ["0001"] * 24),
         },
     )
 
@@ -756,6 +1070,8 @@ def test_process_era5_data_single_level_success(
     assert "valid_time" in result.columns
     assert "latitude" in result.columns
     assert "longitude" in result.columns
+    assert result["t2m"].dtype == np.float32
+    assert isinstance(result["expver"].dtype, pd.CategoricalDtype)
 
     # Verify function calls
     mock_download.assert_called_once()
@@ -764,6 +1080,67 @@ def test_process_era5_data_single_level_success(
     mock_logger.info.assert_called()
 
 
+def test_save_results_raw_data(
+    temp_dir: str, basic_params: ProcessingParams, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the raw export leaves out the ensemble columns"""
+    monkeypatch.chdir(temp_dir)
+    raw_df = pd.DataFrame(
+        {"valid_time": ["2020-01-01"], "number": [0], "expver": ["0001"], "t2m": [1.0]}
+    )
+
+    save_results(
+        basic_params, pd.DataFrame({"t2m": [1.0]}), pd.DataFrame(), raw_df, True
+    )
+
+    output_dir = Path(temp_dir) / f"{basic_params.request_id}_output"
+    saved = pd.read_csv(output_dir / f"{basic_params.request_id}_raw_data.csv")
+    assert list(saved.columns) == ["valid_time", "t2m"]
+    assert list(raw_df.columns) == ["valid_time", "number", "expver", "t2m"]
+
+
+def test_drop_duplicate_rows():
+    """Test that duplicate removal matches pandas drop_duplicates"""
+    times = pd.date_range("2020-01-01", periods=3, freq="h")
+    df = pd.DataFrame(
+        {
+            "valid_time": np.repeat(times, 4),
+            "latitude": [37.5, 37.5, np.nan, np.nan] * 3,
+            "longitude": [-122.5, -122.5, -122.0, -122.0] * 3,
+            "t2m": np.arange(12, dtype=float),
+        }
+    )
+    subset = ["valid_time", "latitude", "longitude"]
+
+    # Dense key space (packed keys) and a sparse one (pandas fallback)
+    for frame in [df, df.iloc[::-5]]:
+        expected = frame.drop_duplicates(subset=subset)
+        pd.testing.assert_frame_equal(_drop_duplicate_rows(frame, subset), expected)
+
+    unique = df.drop_duplicates(subset=subset)
+    assert _drop_duplicate_rows(unique, subset) is unique
+
+
+def test_to_float32():
+    """Test that only double precision data variables are downcast"""
+    ds = xr.Dataset(
+        {
+            "t2m": (["latitude"], np.array([280.5, 281.25])),
+            "expver": (["latitude"], np.array(["0001", "0005"])),
+            "number": (["latitude"], np.array([0, 1])),
+        },
+        coords={"latitude": [37.5, 38.0]},
+    )
+
+    result = _to_float32(ds)
+
+    assert result["t2m"].dtype == np.float32
+    assert result["expver"].dtype == ds["expver"].dtype
+    assert result["number"].dtype == ds["number"].dtype
+    assert result["latitude"].dtype == np.float64
+    np.testing.assert_array_equal(result["t2m"].values, [280.5, 281.25])
+
+
 @patch("varunayan.core.logger")
 @patch("varunayan.core.filter_netcdf_by_shapefile")
 @patch("varunayan.core.extract_download")
@@ -985,6 +1362,41 @@ def test_process_era5_data_no_valid_files(
         process_era5_data(basic_params)
 
 
+@patch("varunayan.core.logger")
+@patch("varunayan.core.extract_download")
+@patch("varunayan.core.download_with_retry")
+@patch("xarray.open_dataset")
+def test_process_era5_data_skips_empty_files(
+    mock_open_dataset: MagicMock,
+    mock_download: MagicMock,
+    mock_extract: MagicMock,
+    mock_logger: MagicMock,
+    basic_params: ProcessingParams,
+    temp_dir: str,
+):
+    """Test that zero-byte NetCDF files are never handed to xarray"""
+    empty_file = Path(temp_dir) / "empty.nc"
+    empty_file.touch()
+    mock_nc_file = "/tmp/test_data.nc"
+    mock_download.return_value = "/tmp/test_request.zip"
+    mock_extract.return_value = [str(empty_file), mock_nc_file]
+
+    mock_ds = xr.Dataset(
+        {"t2m": (["valid_time", "latitude", "longitude"], np.random.rand(24, 2, 2))},
+        coords={
+            "valid_time": pd.date_range("2020-01-01", periods=24, freq="h"),
+            "latitude": [37.5, 38.0],
+            "longitude": [-122.5, -122.0],
+        },
+    )
+    mock_open_dataset.return_value = mock_ds
+
+    result = process_era5_data(basic_params)
+
+    assert isinstance(result, pd.DataFrame)
+    mock_open_dataset.assert_called_once_with(mock_nc_file)
+
+
 @patch("varunayan.core.logger")
 @patch("varunayan.core.extract_download")
 @patch("varunayan.core.download_with_retry")
@@ -1,6 +1,10 @@
 import datetime as dt
+import os
+from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from varunayan.download import download_era5_pressure_lvl, download_era5_single_lvl
 
 
@@ -94,3 +98,53 @@ def test_download_era5_pressure_lvl_mo(mock_client: MagicMock):
 
     assert isinstance(result, str)
     assert result.endswith(".nc")
+
+
+@patch("varunayan.download.era5_downloader.cdsapi.Client")
+def test_download_era5_single_lvl_date_components(mock_client: MagicMock):
+    download_era5_single_lvl(
+        request_id="test",
+        variables=["t2m"],
+        start_date=dt.datetime(year=2019, month=12, day=30),
+        end_date=dt.datetime(year=2020, month=1, day=2),
+        north=38.0,
+        south=37.5,
+        east=-122.0,
+        west=-122.5,
+    )
+
+    request = mock_client.return_value.retrieve.call_args[0][1]
+    assert request["year"] == ["2019", "2020"]
+    assert request["month"] == ["01", "12"]
+    assert request["day"] == ["01", "02", "30", "31"]
+
+
+@patch("varunayan.download.era5_downloader.cdsapi.Client")
+def test_download_era5_single_lvl_uses_cache(
+    mock_client: MagicMock, temp_dir: str, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("VARUNAYAN_CACHE_DIR", os.path.join(temp_dir, "cache"))
+
+    def fake_retrieve(dataset: str, request: Dict[str, Any], target: str):
+        with open(target, "wb") as f:
+            f.write(b"era5")
+
+    mock_client.return_value.retrieve.side_effect = fake_retrieve
+    kwargs: Dict[str, Any] = dict(
+        request_id="test_cache",
+        variables=["t2m"],
+        start_date=dt.datetime(year=2020, month=1, day=1),
+        end_date=dt.datetime(year=2020, month=1, day=2),
+        north=38.0,
+        south=37.5,
+        east=-122.0,
+        west=-122.5,
+    )
+
+    for _ in range(2):
+        result = download_era5_single_lvl(**kwargs)
+        with open(result, "rb") as f:
+            assert f.read() == b"era5"
+        os.remove(result)
+
+    assert mock_client.return_value.retrieve.call_count == 1
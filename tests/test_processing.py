@@ -1,3 +1,5 @@
+import os
+import zipfile
 from typing import Any, Dict
 
 import numpy as np
@@ -8,8 +10,11 @@ import xarray as xr
 from varunayan.processing import (
     aggregate_by_frequency,
     aggregate_pressure_levels,
+    extract_download,
     filter_netcdf_by_shapefile,
+    get_unique_coordinates_in_polygon,
 )
+from varunayan.processing.data_aggregator import _spatial_aggregate
 
 
 def test_aggregate_by_frequency_hourly():
@@ -91,6 +96,135 @@ def test_aggregate_pressure_levels():
     assert result[result["pressure_level"] == 500]["z"].eq(5000).all()  # type: ignore
 
 
+def test_spatial_aggregate_matches_groupby():
+    times = pd.date_range("2020-01-01", periods=4, freq="h")
+    df = pd.DataFrame(
+        {
+            "valid_time": np.tile(times, 3),
+            "t2m": [
+                1.0,
+                2.0,
+                np.nan,
+                4.0,
+                5.0,
+                6.0,
+                np.nan,
+                8.0,
+                9.0,
+                10.0,
+                np.nan,
+                12,
+            ],
+            "mx2t": np.arange(12, dtype=float),
+            "mn2t": np.arange(12, 0, -1, dtype=float),
+        }
+    )
+    spec = {"t2m": "mean", "mx2t": "max", "mn2t": "min"}
+
+    # Regular layout (reshaped) and irregular layout (group engine fallback)
+    for frame in [df, df.drop(index=[5])]:
+        expected = frame.groupby(["valid_time"], as_index=False).agg(spec)
+        result = _spatial_aggregate(frame, "valid_time", spec)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_aggregate_pressure_levels_daily():
+    times = pd.date_range("2020-01-01", periods=48, freq="h")
+    df = pd.DataFrame(
+        {
+            "valid_time": np.repeat(times, 2),
+            "latitude": 37.5,
+            "longitude": -122.5,
+            "pressure_level": np.tile([850, 500], len(times)),
+            "t": np.arange(2 * len(times), dtype=float),
+        }
+    )
+
+    result, _ = aggregate_pressure_levels(df, "daily")
+
+    assert list(result.columns[:3]) == ["t", "pressure_level", "year"]
+    assert result["pressure_level"].tolist() == [850, 850, 500, 500]
+    assert result["day"].tolist() == [1, 2, 1, 2]
+    assert result["t"].tolist() == [23.0, 71.0, 24.0, 72.0]
+    # The caller's frame (also written as raw output) keeps its precision
+    assert df["t"].dtype == np.float64
+
+
+def test_aggregate_pressure_levels_yearly():
+    times = pd.date_range("2020-12-31", periods=48, freq="h")
+    df = pd.DataFrame(
+        {
+            "valid_time": times,
+            "latitude": 37.5,
+            "longitude": -122.5,
+            "pressure_level": 500,
+            "t": np.arange(len(times), dtype=float),
+        }
+    )
+
+    result, _ = aggregate_pressure_levels(df, "yearly")
+
+    assert result["year"].tolist() == [2020, 2021]
+    assert result["t"].tolist() == [11.5, 35.5]
+
+
+def test_aggregate_by_frequency_adds_date_columns():
+    times = pd.Series(
+        pd.to_datetime(
+            ["2020-01-01 23:00", "2020-01-01 23:00", None, "2020-01-02 00:00"]
+        )
+    )
+    df = pd.DataFrame(
+        {"valid_time": times, "latitude": 1.0, "longitude": 2.0, "t2m": 280.0}
+    )
+
+    aggregate_by_frequency(df, "daily")
+
+    assert df["date"].equals(times.dt.date)
+    assert df["hour"].equals(times.dt.hour)
+
+    whole_hours = times.dropna().reset_index(drop=True)
+    df = pd.DataFrame(
+        {"valid_time": whole_hours, "latitude": 1.0, "longitude": 2.0, "t2m": 280.0}
+    )
+    aggregate_by_frequency(df, "daily")
+    assert df["hour"].equals(whole_hours.dt.hour)
+
+
+def test_aggregate_by_frequency_column_categories():
+    df = pd.DataFrame(
+        {
+            "valid_time": pd.date_range("2020-01-01", periods=4, freq="6h"),
+            "latitude": [37.5] * 4,
+            "longitude": [-122.5] * 4,
+            "t2m": [280.0, 282.0, 284.0, 286.0],
+            "tp": [0.1, 0.2, 0.3, 0.4],
+            "mx2t": [281.0, 289.0, 285.0, 287.0],
+            "mn2t": [279.0, 275.0, 277.0, 278.0],
+            # Matches "snowfall" (summed) by token; the rate category decides
+            # how it is aggregated, the sum category where it is placed
+            "large_scale_snowfall_rate": [1.0, 2.0, 3.0, 6.0],
+        }
+    )
+
+    result, _ = aggregate_by_frequency(df, "daily")
+
+    row = result.iloc[0]
+    assert row["t2m"] == 283.0
+    assert np.isclose(row["tp"], 1.0)
+    assert row["mx2t"] == 289.0
+    assert row["mn2t"] == 275.0
+    assert row["large_scale_snowfall_rate"] == 3.0
+    assert list(result.columns[:5]) == [
+        "tp",
+        "large_scale_snowfall_rate",
+        "mx2t",
+        "mn2t",
+        "t2m",
+    ]
+    assert df["t2m"].dtype == np.float64
+
+
 def test_filter_netcdf_by_shapefile(sample_geojson: Dict[str, Any]):
     """Test filtering NetCDF data by GeoJSON polygon"""
     # Create a mock xarray Dataset
@@ -113,3 +247,189 @@ def test_filter_netcdf_by_shapefile(sample_geojson: Dict[str, Any]):
     assert len(result) > 0
     assert all(37.5 <= lat <= 38.0 for lat in result["latitude"])
     assert all(-122.5 <= lon <= -122.0 for lon in result["longitude"])
+
+
+def test_filter_netcdf_by_shapefile_keeps_only_inside_points(
+    sample_geojson: Dict[str, Any],
+):
+    lats = np.arange(37.25, 38.5, 0.25)
+    lons = np.arange(-122.75, -121.5, 0.25)
+    ds = xr.Dataset(
+        data_vars={
+            "t2m": (
+                ("time", "latitude", "longitude"),
+                np.arange(2 * len(lats) * len(lons), dtype=float).reshape(
+                    2, len(lats), len(lons)
+                ),
+            )
+        },
+        coords={
+            "time": pd.date_range("2020-01-01", periods=2),
+            "latitude": lats,
+            "longitude": lons,
+        },
+    )
+
+    result = filter_netcdf_by_shapefile(ds, sample_geojson)
+
+    assert len(result) == 2 * 3 * 3
+    expected = ds["t2m"].sel(time="2020-01-02", latitude=37.75, longitude=-122.25)
+    row = result[
+        (result["time"] == pd.Timestamp("2020-01-02"))
+        & (result["latitude"] == 37.75)
+        & (result["longitude"] == -122.25)
+    ]
+    assert row["t2m"].item() == expected.item()
+
+
+def test_get_unique_coordinates_in_polygon(sample_geojson: Dict[str, Any]):
+    ds = xr.Dataset(
+        coords={
+            "latitude": [37.4, 37.5, 37.75, 38.1],
+            "longitude": [-122.6, -122.5, -122.25, -121.9],
+        }
+    )
+    result = get_unique_coordinates_in_polygon(ds, sample_geojson)
+    # Points on the polygon boundary count as inside
+    assert sorted(result["latitude"].unique()) == [37.5, 37.75]
+    assert sorted(result["longitude"].unique()) == [-122.5, -122.25]
+    assert len(result) == 4
+
+
+def test_filter_netcdf_by_shapefile_multiple_features():
+    def square(west: float, south: float, size: float) -> Dict[str, Any]:
+        ring = [
+            [west, south],
+            [west + size, south],
+            [west + size, south + size],
+            [west, south + size],
+            [west, south],
+        ]
+        return {
+            "type": "Feature",
+            "properties": {"name": f"{west}"},
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+        }
+
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [square(0.0, 0.0, 1.0), square(1.0, 0.0, 1.0)],
+    }
+    ds = xr.Dataset(
+        data_vars={
+            "t2m": (("latitude", "longitude"), np.ones((3, 5))),
+        },
+        coords={"latitude": [0.0, 0.5, 1.5], "longitude": [-0.5, 0.5, 1.0, 1.5, 2.5]},
+    )
+
+    result = filter_netcdf_by_shapefile(ds, geojson, dist_features=["name"])
+
+    by_feature = result.groupby("feature")["longitude"].apply(sorted).to_dict()
+    # The shared edge at longitude 1.0 belongs to both features
+    assert by_feature == {"0.0": [0.5, 0.5, 1.0, 1.0], "1.0": [1.0, 1.0, 1.5, 1.5]}
+    assert set(result["latitude"]) == {0.0, 0.5}
+
+    unique = get_unique_coordinates_in_polygon(ds, geojson)
+    assert len(unique) == 2 * 3
+
+
+def test_get_unique_coordinates_in_polygon_adjacent_features():
+    def square(west: float) -> Dict[str, Any]:
+        ring = [[west, 0.0], [west + 1, 0.0], [west + 1, 1.0], [west, 1.0], [west, 0.0]]
+        return {
+            "type": "Feature",
+            "properties": {},
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+        }
+
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [square(0.0), square(1.0)],
+    }
+    ds = xr.Dataset(
+        coords={
+            "latitude": [1.5, 1.0, 0.5, 0.0],
+            "longitude": [-0.5, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5],
+        }
+    )
+
+    result = get_unique_coordinates_in_polygon(ds, geojson)
+
+    # Grid points on the shared edge (longitude 1.0) and on the outer edges of
+    # either feature count as inside
+    points = set(zip(result["latitude"], result["longitude"]))
+    assert points == {
+        (lat, lon) for lat in (0.0, 0.5, 1.0) for lon in (0.0, 0.5, 1.0, 1.5, 2.0)
+    }
+    assert len(result) == len(points)
+
+
+def test_filter_netcdf_by_shapefile_non_rectangular_region():
+    triangle = {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[0.0, 0.0], [2.0, 0.0], [0.0, 2.0], [0.0, 0.0]]],
+        },
+    }
+    lats = [2.0, 1.0, 0.0]
+    lons = [0.0, 1.0, 2.0]
+    ds = xr.Dataset(
+        data_vars={
+            "t2m": (
+                ("valid_time", "latitude", "longitude"),
+                np.arange(18, dtype=float).reshape(2, 3, 3),
+            )
+        },
+        coords={
+            "valid_time": pd.date_range("2020-01-01", periods=2),
+            "latitude": lats,
+            "longitude": lons,
+            "number": 0,
+        },
+    )
+
+    result = filter_netcdf_by_shapefile(ds, triangle)
+
+    full = ds.to_dataframe().reset_index()
+    inside = full[full["latitude"] + full["longitude"] <= 2.0]
+    assert list(result.columns) == [
+        "latitude",
+        "longitude",
+        "feature",
+        "valid_time",
+        "t2m",
+        "number",
+    ]
+    assert len(result) == len(inside) == 2 * 6
+    merged = result.merge(inside, on=["valid_time", "latitude", "longitude"])
+    assert (merged["t2m_x"] == merged["t2m_y"]).all()
+
+
+def test_extract_download_only_netcdf_members(temp_dir: str):
+    zip_path = os.path.join(temp_dir, "download.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("data_stream-oper.nc", b"nc")
+        zf.writestr("sub/data_stream-wave.nc", b"nc")
+        zf.writestr("metadata.json", b"{}")
+
+    extract_dir = os.path.join(temp_dir, "extracted")
+    nc_files = extract_download(zip_path, extract_dir)
+
+    assert sorted(os.path.relpath(f, extract_dir) for f in nc_files) == [
+        "data_stream-oper.nc",
+        os.path.join("sub", "data_stream-wave.nc"),
+    ]
+    assert all(os.path.exists(f) for f in nc_files)
+    assert not os.path.exists(os.path.join(extract_dir, "metadata.json"))
+
+
+def test_extract_download_single_netcdf_is_not_copied(temp_dir: str):
+    nc_path = os.path.join(temp_dir, "download.nc")
+    with open(nc_path, "wb") as f:
+        f.write(b"CDF\x01")
+
+    extract_dir = os.path.join(temp_dir, "extracted")
+    assert extract_download(nc_path, extract_dir) == [nc_path]
+    assert not os.path.exists(extract_dir)
@@ -1,12 +1,18 @@
+import json
+import os
 from typing import Any, Dict
 
+import pytest
+
 from varunayan.util import (
     convert_to_geojson,
     create_geojson_from_bbox,
+    create_temp_geojson,
     extract_coords_from_geometry,
     get_bounding_box,
     is_valid_geojson,
     load_json_with_encoding,
+    read_bbox_only_json,
 )
 
 
@@ -26,6 +32,44 @@ def test_get_bounding_box(sample_geojson: Dict[str, Any]):
     assert bbox[3] == 38.0  # north
 
 
+def test_get_bounding_box_multiple_features():
+    collection = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "type": "MultiPolygon",
+                    "coordinates": [
+                        [
+                            [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                            [[1, 1], [2, 1], [2, 2], [1, 1]],
+                        ]
+                    ],
+                },
+            },
+            {
+                "type": "Feature",
+                # Only the coordinates count, not a feature's own bbox
+                "bbox": [-3.0, -1.0, 2.0, 6.0],
+                "properties": {},
+                "geometry": {"type": "Point", "coordinates": [1, 1, 250]},
+            },
+            {
+                "type": "Feature",
+                "properties": {},
+                # A ring mixing 2-D and 3-D positions
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[3, 3], [5, 3, 10], [5, 5], [3, 3, 10]]],
+                },
+            },
+        ],
+    }
+    assert get_bounding_box(collection) == (0.0, 0.0, 5.0, 5.0)
+
+
 def test_load_json_with_encoding(sample_geojson_file: str):
     data = load_json_with_encoding(sample_geojson_file)
     assert isinstance(data, dict)
@@ -35,6 +79,10 @@ def test_load_json_with_encoding(sample_geojson_file: str):
 def test_is_valid_geojson(sample_geojson: Dict[str, Any]):
     assert is_valid_geojson(sample_geojson) is True
     assert is_valid_geojson({"invalid": "data"}) is False
+    assert is_valid_geojson({"type": "Point", "coordinates": [0, 0]}) is True
+    assert is_valid_geojson({"type": "Point"}) is False
+    assert is_valid_geojson({"type": "FeatureCollection", "features": {}}) is False
+    assert is_valid_geojson({"type": ["Feature"]}) is False
 
 
 def test_convert_to_geojson():
@@ -48,8 +96,59 @@ def test_convert_to_geojson():
     assert is_valid_geojson(geojson)
 
 
+def test_convert_to_geojson_from_bbox_sequence():
+    expected = (-122.5, 37.5, -122.0, 38.0)
+    assert get_bounding_box(convert_to_geojson({"bbox": expected})) == expected
+    with pytest.raises(ValueError):
+        convert_to_geojson({"bbox": [1, 2]})
+
+
+def test_convert_to_geojson_from_bounds():
+    bounds = {"North": 38.0, "south": 37.5, "EAST": -122.0, "West": -122.5}
+    geojson = convert_to_geojson(bounds)
+    assert get_bounding_box(geojson) == (-122.5, 37.5, -122.0, 38.0)
+
+
 def test_create_geojson_from_bbox():
     geojson = create_geojson_from_bbox(-122.5, 37.5, -122.0, 38.0)
     assert is_valid_geojson(geojson)
     bbox = get_bounding_box(geojson)
     assert bbox == (-122.5, 37.5, -122.0, 38.0)
+    assert geojson["properties"]["description"].startswith("Bounding box: N:38.0")
+    assert geojson["geometry"]["coordinates"][0][0] == [-122.5, 37.5]
+
+    bare = create_geojson_from_bbox(-122.5, 37.5, -122.0, 38.0, describe=False)
+    assert bare["properties"] == {}
+
+
+def test_create_temp_geojson(sample_geojson: Dict[str, Any]):
+    with pytest.deprecated_call():
+        temp_file = create_temp_geojson(sample_geojson, "test_util_temp")
+    try:
+        assert temp_file.endswith("_test_util_temp_temp_geojson.json")
+        assert load_json_with_encoding(temp_file) == sample_geojson
+    finally:
+        os.remove(temp_file)
+
+    with pytest.deprecated_call(), pytest.raises(ValueError):
+        create_temp_geojson(sample_geojson, "../escape")
+
+
+def test_load_json_with_encoding_utf16(sample_geojson: Dict[str, Any], temp_dir: str):
+    file_path = os.path.join(temp_dir, "test_utf16.geojson")
+    with open(file_path, "w", encoding="utf-16") as f:
+        json.dump(sample_geojson, f)
+    assert load_json_with_encoding(file_path) == sample_geojson
+
+
+def test_read_bbox_only_json(sample_geojson: Dict[str, Any], temp_dir: str):
+    bbox_path = os.path.join(temp_dir, "bbox.json")
+    with open(bbox_path, "w") as f:
+        f.write('{"bbox": [-10.5, 35, 40, 7.1e1]}\n')
+    assert read_bbox_only_json(bbox_path) == (-10.5, 35.0, 40.0, 71.0)
+
+    # Anything beyond a bare bbox goes through the regular JSON loader
+    feature_path = os.path.join(temp_dir, "feature.json")
+    with open(feature_path, "w") as f:
+        json.dump({"bbox": [0, 0, 1, 1], **sample_geojson}, f)
+    assert read_bbox_only_json(feature_path) is None
@@ -1,5 +1,5 @@
 from .config import ensure_cdsapi_config
-from .core import era5ify_bbox, era5ify_geojson, era5ify_point
+from .core import era5ify_bbox, era5ify_geojson, era5ify_many, era5ify_point
 from .search_and_desc import describe_variables, search_variable
 
 ensure_cdsapi_config()
@@ -8,6 +8,7 @@ __all__ = [
     "era5ify_geojson",
     "era5ify_bbox",
     "era5ify_point",
+    "era5ify_many",
     "describe_variables",
     "search_variable",
 ]
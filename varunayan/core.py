@@ -1,18 +1,34 @@
+import contextlib
+import copy
 import datetime as dt
-import glob
+import functools
 import logging
 import math
 import os
+import random
+import re
 import shutil
 import tempfile
 import time
 from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import numpy as np
 import pandas as pd
-import xarray as xr
+import shapely
+from pandas.api.types import union_categoricals
 from shapely.geometry import Point, shape
 from shapely.ops import unary_union
 
@@ -36,19 +52,25 @@ from .util import (
     Colors,
     convert_to_geojson,
     create_geojson_from_bbox,
-    create_temp_geojson,
     get_bounding_box,
     get_logger,
     is_valid_geojson,
     load_json_with_encoding,
+    read_bbox_only_json,
     set_v_geoj_utl,
 )
 
+if TYPE_CHECKING:
+    import xarray as xr
+
 logger = get_logger(level=logging.DEBUG)
 always_logger = get_logger(name="log_always", level=logging.INFO)
 
 SUM_VARS = sum_vars
 
+# Most fields (variable x level x time step) CDS accepts in one ERA5 request
+MAX_FIELDS_PER_REQUEST = 120_000
+
 
 @dataclass
 class ProcessingParams:
@@ -67,6 +89,7 @@ class ProcessingParams:
     geojson_file: Optional[str] = None
     geojson_data: Optional[Dict[str, Any]] = None
     dist_features: Optional[List[str]] = None
+    max_workers: int = 1
 
 
 def set_verbosity(verbosity: int) -> None:
@@ -101,7 +124,11 @@ def download_with_retry(
 ) -> Optional[str]:
     """Generic download function with retry logic"""
     max_retries = 5
-    retry_delay = 30
+    # Exponential backoff: up to 10, 20, 40, 80 then 120 seconds between
+    # attempts, jittered so concurrent chunks that failed together don't
+    # all retry at the same moment
+    retry_delay = 10
+    max_retry_delay = 120
 
     download_args = {
         "request_id": chunk_id or params.request_id,
@@ -136,7 +163,8 @@ def download_with_retry(
             )
 
             if attempt < max_retries:
-                time.sleep(retry_delay)
+                delay = min(retry_delay * 2**attempt, max_retry_delay)
+                time.sleep(random.uniform(delay / 2, delay))
             else:
                 logger.error(
                     f"  {Colors.RED}✗ All {max_retries + 1} download attempts failed{Colors.RESET}"
@@ -146,18 +174,18 @@ def download_with_retry(
     raise RuntimeError("Download failed after maximum retries")
 
 
-def process_time_chunks(
-    params: ProcessingParams,
-    download_func: Callable[..., Optional[str]],
-    process_func: Callable[
-        [ProcessingParams, Optional[int], Optional[int]], Optional[pd.DataFrame]
-    ],
-) -> Optional[pd.DataFrame]:
-    """Handle time-based chunking of downloads and processing"""
+def _chunk_plan(params: ProcessingParams) -> Tuple[bool, int, int]:
+    """
+    Whether the monthly dataset is used, the number of months or days
+    requested, and the most of them one request may cover. Chunks are
+    shortened when the variables and pressure levels asked for would
+    otherwise exceed the CDS per-request field limit.
+    """
     use_monthly = params.frequency in ["monthly", "yearly"]
 
     if use_monthly:
         max_per_chunk = 100  # months
+        steps_per_unit = 1  # one monthly mean per month
         total_units = (
             (params.end_date.year - params.start_date.year) * 12
             + (params.end_date.month - params.start_date.month)
@@ -165,49 +193,68 @@ def process_time_chunks(
         )
     else:
         max_per_chunk = 14  # days
+        steps_per_unit = 24  # hourly fields per day
         total_units = (params.end_date - params.start_date).days + 1
 
+    fields_per_unit = (
+        len(params.variables) * max(len(params.pressure_levels or []), 1)
+    ) * steps_per_unit
+    max_per_chunk = max(
+        1, min(max_per_chunk, MAX_FIELDS_PER_REQUEST // max(fields_per_unit, 1))
+    )
+    return use_monthly, total_units, max_per_chunk
+
+
+def _iter_chunks(
+    start: dt.datetime, end: dt.datetime, use_monthly: bool, max_per_chunk: int
+) -> Iterator[Tuple[dt.datetime, dt.datetime]]:
+    """Yield (chunk_start, chunk_end) ranges of at most max_per_chunk months or days"""
+    current_date = start
+    while current_date <= end:
+        if use_monthly:
+            # Last day of the max_per_chunk-th month, counting the current one
+            months = current_date.month - 1 + max_per_chunk - 1
+            year, month = current_date.year + months // 12, months % 12 + 1
+            chunk_end = min(dt.datetime(year, month, monthrange(year, month)[1]), end)
+        else:
+            chunk_end = min(current_date + dt.timedelta(days=max_per_chunk - 1), end)
+        yield current_date, chunk_end
+        current_date = chunk_end + dt.timedelta(days=1)
+
+
+def process_time_chunks(
+    params: ProcessingParams,
+    download_func: Callable[..., Optional[str]],
+    process_func: Callable[
+        [ProcessingParams, Optional[int], Optional[int]], Optional[pd.DataFrame]
+    ],
+) -> Optional[pd.DataFrame]:
+    """Handle time-based chunking of downloads and processing"""
+    use_monthly, total_units, max_per_chunk = _chunk_plan(params)
     needs_chunking = total_units > max_per_chunk
-    all_data: List[pd.DataFrame] = []
 
     if not needs_chunking:
         return process_func(params, 1, 1)
 
-    # Chunked processing
-    current_date = params.start_date
-    chunk_number = 1
-    total_chunks = math.ceil(total_units / max_per_chunk)
-
-    while current_date <= params.end_date:
-        chunk_params = ProcessingParams(**params.__dict__)
-
-        # Calculate chunk dates
-        if use_monthly:
-            chunk_end_year = current_date.year + (
-                (current_date.month - 1 + max_per_chunk - 1) // 12
-            )
-            chunk_end_month = ((current_date.month - 1 + max_per_chunk - 1) % 12) + 1
-            next_month = dt.datetime(
-                chunk_end_year, chunk_end_month, 28
-            ) + dt.timedelta(days=4)
-            chunk_end = min(
-                next_month - dt.timedelta(days=next_month.day), params.end_date
-            )
-        else:
-            chunk_end = min(
-                current_date + dt.timedelta(days=max_per_chunk - 1), params.end_date
-            )
+    # Work out the chunk date ranges up front
+    chunks = list(
+        _iter_chunks(params.start_date, params.end_date, use_monthly, max_per_chunk)
+    )
+    total_chunks = len(chunks)
 
+    def run_chunk(chunk_number: int) -> Optional[pd.DataFrame]:
+        chunk_start, chunk_end = chunks[chunk_number - 1]
         chunk_msg = (
             f"{Colors.CYAN}PROCESSING CHUNK {chunk_number}/{total_chunks}{Colors.RESET}\n"
-            f"Date Range: {current_date.strftime('%Y-%m-%d')} to {chunk_end.strftime('%Y-%m-%d')}\n"
+            f"Date Range: {chunk_start.strftime('%Y-%m-%d')} to {chunk_end.strftime('%Y-%m-%d')}\n"
             f"Variables:  {', '.join(params.variables)}"
         )
         if params.pressure_levels:
             chunk_msg += f"\nLevels:     {', '.join(params.pressure_levels)}"
         logger.info(chunk_msg)
 
-        chunk_params.start_date = current_date
+        chunk_params = ProcessingParams(**params.__dict__)
+        chunk_params.start_date = chunk_start
         chunk_params.end_date = chunk_end
 
         try:
@@ -217,31 +264,130 @@ def process_time_chunks(
             logger.info(
                 f"{Colors.GREEN}✓ Chunk completed in {elapsed:.1f} seconds{Colors.RESET}"
             )
-            if chunk_data is not None:
-                all_data.append(chunk_data)
+            return chunk_data
         except Exception as e:
             logger.error(
                 f"  {Colors.RED}✗ Error processing chunk {chunk_number}: {e}{Colors.RESET}"
             )
-
-        # Prepare for next chunk
-        chunk_number += 1
-        current_date = chunk_end + dt.timedelta(days=1)
-
-        if chunk_number <= total_chunks:
-            time.sleep(10)  # Rate limiting
+            return None
+
+    results: List[Optional[pd.DataFrame]] = []
+    if params.max_workers <= 1:
+        # Each request has completed before the next is sent, so there is
+        # nothing to space out; download_with_retry backs off on failures
+        results = [
+            run_chunk(chunk_number) for chunk_number in range(1, total_chunks + 1)
+        ]
+    else:
+        # Chunks download under their own request ids, so several can be queued
+        # at CDS at once; submissions are still spaced out for rate limiting
+        with ThreadPoolExecutor(max_workers=params.max_workers) as executor:
+            futures = []
+            for chunk_number in range(1, total_chunks + 1):
+                futures.append(executor.submit(run_chunk, chunk_number))
+                if chunk_number < total_chunks:
+                    time.sleep(10)  # Rate limiting
+            results = [future.result() for future in futures]
+
+    all_data = [chunk_data for chunk_data in results if chunk_data is not None]
 
     if not all_data:
         raise ValueError("No data was successfully processed from any chunk")
 
+    _unify_categories(all_data)
     return pd.concat(all_data, ignore_index=True)
 
 
+def _unify_categories(frames: List[pd.DataFrame]) -> None:
+    """
+    Give categorical columns (such as expver) the same categories in every
+    frame, in place, so that concatenating the frames keeps them categorical
+    instead of falling back to object dtype.
+    """
+    for col in frames[0].columns:
+        columns = [frame[col] for frame in frames if col in frame.columns]
+        if len(columns) != len(frames) or not all(
+            isinstance(column.dtype, pd.CategoricalDtype) for column in columns
+        ):
+            continue
+        categories = union_categoricals(columns).categories
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+
+
+def _is_empty_file(path: str) -> bool:
+    """Check whether a file exists on disk but holds no data"""
+    try:
+        return os.path.getsize(path) == 0
+    except OSError:
+        return False
+
+
+def _to_float32(ds: "xr.Dataset") -> "xr.Dataset":
+    """Downcast double precision data variables to float32.
+    ERA5 values are packed as 16-bit integers, so float32 holds them without
+    loss while halving the memory of every frame built from the dataset."""
+    doubles = {
+        name: da.astype(np.float32)
+        for name, da in ds.data_vars.items()
+        if da.dtype == np.float64
+    }
+    return ds.assign(doubles) if doubles else ds
+
+
+def _iter_datasets(nc_files: List[str]) -> Iterator["xr.Dataset"]:
+    """Open NetCDF files one at a time, logging and skipping unreadable ones"""
+    import xarray as xr
+
+    for i, nc_file in enumerate(nc_files, 1):
+        logger.debug(
+            f"  Processing file {i}/{len(nc_files)}: {os.path.basename(nc_file)}"
+        )
+        try:
+            ds = xr.open_dataset(nc_file)
+        except Exception as e:
+            logger.error(
+                f"    {Colors.RED}✗ Error processing {nc_file}: {e}{Colors.RESET}"
+            )
+            continue
+        logger.debug(f"  ✓ Loaded: Dimensions: {ds.sizes}")
+        yield _to_float32(ds)
+
+
+def _drop_duplicate_rows(df: pd.DataFrame, subset: List[str]) -> pd.DataFrame:
+    """
+    Same rows as df.drop_duplicates(subset=subset). Each key column is
+    factorized and the codes are packed into one int64 key per row, whose
+    first occurrences are found with a NumPy scatter instead of hashing the
+    three or four key columns together.
+    """
+    n_rows = len(df)
+    key = np.zeros(n_rows, dtype=np.int64)
+    radix = 1
+    for col in subset:
+        codes, uniques = pd.factorize(df[col])
+        # Missing values get code -1, shifted to 0 so they compare equal
+        n_codes = len(uniques) + 1
+        radix *= n_codes
+        if radix > 4 * n_rows:
+            # Too sparse a key space for the scatter table to pay off
+            return cast(pd.DataFrame, df.drop_duplicates(subset=subset))
+        key = key * n_codes + (codes + 1)
+
+    positions = np.arange(n_rows)
+    first_seen = np.full(radix, n_rows, dtype=np.int64)
+    np.minimum.at(first_seen, key, positions)
+    keep = first_seen[key] == positions
+    return df if keep.all() else cast(pd.DataFrame, df[keep])
+
+
 # pyright: reportUnknownMemberType=false
 def process_era5_data(
     params: ProcessingParams, chunk_info: Optional[Tuple[int, int]] = None
 ) -> Optional[pd.DataFrame]:
     """Core processing function for both single and pressure level data"""
+    import xarray as xr
+
     chunk_number, total_chunks = chunk_info or (1, 1)
 
     # Determine download function
@@ -263,31 +409,23 @@ def process_era5_data(
     nc_files: List[str] = []
     if download_file is not None:
         nc_files = extract_download(download_file)
-    datasets: List[xr.Dataset] = []
 
     logger.info("\nProcessing downloaded data:")
     logger.info(f"- Found {len(nc_files)} file(s)")
 
-    for i, nc_file in enumerate(nc_files, 1):
-        if not nc_file.lower().endswith(".nc"):
-            continue
-        logger.debug(
-            f"  Processing file {i}/{len(nc_files)}: {os.path.basename(nc_file)}"
-        )
-        try:
-            ds: xr.Dataset = xr.open_dataset(nc_file)
-            logger.debug(f"  ✓ Loaded: Dimensions: {ds.sizes}")
-            datasets.append(ds)
-        except Exception as e:
-            logger.error(
-                f"    {Colors.RED}✗ Error processing {nc_file}: {e}{Colors.RESET}"
-            )
+    # Keep only NetCDF payloads; truncated (empty) files can never be opened
+    nc_files = [
+        f for f in nc_files if f.lower().endswith(".nc") and not _is_empty_file(f)
+    ]
 
+    # combine_by_coords materialises its input as a list anyway, so hand it one
+    datasets = list(_iter_datasets(nc_files))
     if not datasets:
         raise ValueError("No valid datasets were processed")
 
-    # Merge and convert to DataFrame
-    merged_ds: xr.Dataset = xr.merge(datasets) if len(datasets) > 1 else datasets[0]
+    merged_ds = cast(
+        xr.Dataset, xr.combine_by_coords(datasets, combine_attrs="override")
+    )
 
     # Apply filtering if GeoJSON provided
     if params.geojson_data:
@@ -297,13 +435,17 @@ def process_era5_data(
     else:
         df = merged_ds.to_dataframe().reset_index()
 
+    # expver repeats one or two labels on every row; keep it as category codes
+    if "expver" in df.columns:
+        df["expver"] = df["expver"].astype("category")
+
     # Remove duplicates
     dup_cols = ["valid_time", "latitude", "longitude"]
     if params.pressure_levels:
         dup_cols.append("pressure_level")
 
     initial_rows = len(df)
-    df = df.drop_duplicates(subset=dup_cols)
+    df = _drop_duplicate_rows(df, dup_cols)
     if initial_rows - len(df) > 0:
         logger.debug(
             f"  {Colors.YELLOW}✓ Removed {initial_rows - len(df)} duplicate rows{Colors.RESET}"
@@ -403,11 +545,12 @@ def save_results(
     always_logger.info(f"  Saved unique coordinates to: {csv_output}")
 
     if save_raw:
-        # Drop unwanted columns
-        raw_df = raw_df.drop(columns=["number", "expver"], errors="ignore")
+        # Leave out unwanted columns while writing, without first building a
+        # trimmed copy of the (largest) raw frame
+        raw_columns = [col for col in raw_df.columns if col not in ("number", "expver")]
         # Save raw data
         csv_output = os.path.join(output_dir, f"{params.request_id}_raw_data.csv")
-        raw_df.to_csv(csv_output, index=False)
+        raw_df.to_csv(csv_output, index=False, columns=raw_columns)
         always_logger.info(f"  Saved raw data to: {csv_output}")
 
 
@@ -434,8 +577,9 @@ def process_era5(params: ProcessingParams, save_raw: bool) -> pd.DataFrame:
 
     print_bounding_box(params)
 
-    if params.geojson_data:
-        print("\n\n--- GeoJSON Mini Map ---")
+    # Rendering the map tests every grid cell, so skip it when it won't be shown
+    if params.geojson_data and logger.isEnabledFor(logging.INFO):
+        logger.info("\n\n--- GeoJSON Mini Map ---")
         draw_geojson_ascii(params.geojson_data)
 
     print_processing_strategy(params)
@@ -507,6 +651,24 @@ def load_and_validate_geojson(geojson_file: str) -> Dict[str, Any]:
     return geojson_data
 
 
+@functools.lru_cache(maxsize=32)
+def _load_geojson_cached(geojson_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Cached load_and_validate_geojson for local files, keyed on the absolute path.
+
+    The modification time and size are part of the cache key so that an edited
+    file is parsed again. The returned dict is shared between callers and must
+    not be modified; hand out a copy instead.
+    """
+    # Bare bounding boxes are common and need no JSON parsing at all; the
+    # description property is only for display and is skipped here
+    bbox = read_bbox_only_json(geojson_file)
+    if bbox is not None:
+        return create_geojson_from_bbox(*bbox, describe=False)
+
+    return load_and_validate_geojson(geojson_file)
+
+
 def print_bounding_box(params: ProcessingParams) -> None:
     """Print bounding box information"""
     logger.info("\n--- Bounding Box ---")
@@ -524,20 +686,9 @@ def print_bounding_box(params: ProcessingParams) -> None:
 def print_processing_strategy(params: ProcessingParams) -> None:
     """Print processing strategy information"""
     logger.debug("\n--- Processing Strategy ---")
-    use_monthly = params.frequency in ["monthly", "yearly"]
+    use_monthly, total_units, max_per_chunk = _chunk_plan(params)
     logger.debug(f"Using monthly dataset: {use_monthly}")
 
-    if use_monthly:
-        total_units = (
-            (params.end_date.year - params.start_date.year) * 12
-            + (params.end_date.month - params.start_date.month)
-            + 1
-        )
-        max_per_chunk = 100
-    else:
-        total_units = (params.end_date - params.start_date).days + 1
-        max_per_chunk = 14
-
     needs_chunking = total_units > max_per_chunk
     logger.debug(
         f"Total {'months' if use_monthly else 'days'} to process: {total_units}"
@@ -577,17 +728,20 @@ def draw_geojson_ascii(geojson_data: Dict[str, Any]) -> None:
             shape(feature["geometry"]) for feature in geojson_data.get("features", [])
         ]
         if len(geometries) > 100:
-            print("Too many features in GeoJSON (more than 100). Skipping mini map.")
+            logger.info(
+                "Too many features in GeoJSON (more than 100). Skipping mini map."
+            )
             return
         if not geometries:
-            print("No geometries found in GeoJSON.")
+            logger.info("No geometries found in GeoJSON.")
             return
 
         combined_geom = unary_union(geometries)
         combined_geom = combined_geom.simplify(0.05, preserve_topology=True)
 
-        # Get bounding box
-        west, south, east, north = get_bounding_box(geojson_data)
+        # Get bounding box from the geometries already built above rather
+        # than walking the GeoJSON coordinates again
+        west, south, east, north = map(float, shapely.total_bounds(geometries))
 
         # Calculate dimensions of the ASCII grid
         width, height = calculate_map_dimensions(west, east, south, north)
@@ -597,10 +751,10 @@ def draw_geojson_ascii(geojson_data: Dict[str, Any]) -> None:
         y = np.linspace(south, north, height)
 
         # Print header
-        print(
+        logger.info(
             f"\n{Colors.BLUE}MINI MAP (Longitude: {west:.2f}° to {east:.2f}°, Latitude: {south:.2f}° to {north:.2f}°):{Colors.RESET}"
         )
-        print("┌" + "─" * width + "┐")
+        logger.info("┌" + "─" * width + "┐")
 
         # Render the ASCII map
         for j in range(height - 1, -1, -1):
@@ -612,14 +766,14 @@ def draw_geojson_ascii(geojson_data: Dict[str, Any]) -> None:
                 else:
                     row.append(f"{Colors.RED}·{Colors.RESET}")
             row.append("│")
-            print("".join(row))
+            logger.info("".join(row))
 
-        print("└" + "─" * width + "┘")
-        print(f" {Colors.GREEN}■{Colors.RESET} = Inside the shape")
-        print(f" {Colors.RED}·{Colors.RESET} = Outside the shape")
+        logger.info("└" + "─" * width + "┘")
+        logger.info(f" {Colors.GREEN}■{Colors.RESET} = Inside the shape")
+        logger.info(f" {Colors.RED}·{Colors.RESET} = Outside the shape")
 
     except Exception as e:
-        print(f"{Colors.YELLOW}Couldn't draw mini map: {str(e)}{Colors.RESET}")
+        logger.warning(f"{Colors.YELLOW}Couldn't draw mini map: {str(e)}{Colors.RESET}")
 
 
 def print_processing_footer(
@@ -666,6 +820,7 @@ def era5ify_geojson(
     resolution: float = 0.25,
     verbosity: int = 0,
     save_raw: bool = True,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Public function for querying data for a GeoJSON.
@@ -683,6 +838,7 @@ def era5ify_geojson(
         resolution (float, optional): Spatial resolution in degrees (0.25, 0.1, 0.5, etc.). Defaults to 0.25, minimum is 0.1.
         verbosity (int, optional): Verbosity level (0 for no output, 1 for info output, 2 for debug/complete output). Defaults to 0.
         save_raw (bool, optional): Whether to save the raw data. Defaults to True.
+        max_workers (int, optional): Number of time chunks to download and process concurrently. Defaults to 1 (one chunk at a time).
 
     Returns:
         DataFrame: A DataFrame containing the processed data for the region described by GeoJSON.
@@ -699,12 +855,21 @@ def era5ify_geojson(
             f"Invalid dataset_type: {dataset_type}. Must be 'single' or 'pressure'"
         )
 
-    # Load and validate GeoJSON
-    json_data = load_json_with_encoding(json_file)
-    geojson_data = (
-        json_data if is_valid_geojson(json_data) else convert_to_geojson(json_data)
-    )
-    temp_geojson_file = create_temp_geojson(geojson_data, request_id)
+    # Load and validate GeoJSON, reusing earlier results for unchanged local files
+    geojson_file: Optional[str]
+    try:
+        st = os.stat(json_file)
+    except OSError:
+        geojson_data = load_and_validate_geojson(json_file)
+        geojson_file = None
+    else:
+        # Each call gets its own copy, so changes to params.geojson_data
+        # never leak into the cached entry
+        geojson_data = copy.deepcopy(
+            _load_geojson_cached(os.path.abspath(json_file), st.st_mtime_ns, st.st_size)
+        )
+        # The parsed GeoJSON is handed over in memory; the path is only reported
+        geojson_file = json_file
 
     try:
         params = ProcessingParams(
@@ -716,14 +881,15 @@ def era5ify_geojson(
             resolution=resolution,
             dataset_type=dataset_type,
             pressure_levels=pressure_levels if dataset_type == "pressure" else None,
-            geojson_file=temp_geojson_file,
+            geojson_file=geojson_file,
             geojson_data=geojson_data,
             dist_features=dist_features,
+            max_workers=max_workers,
         )
         return process_era5(params, save_raw)
 
     finally:
-        cleanup_temp_files(request_id, temp_geojson_file)
+        cleanup_temp_files(request_id)
 
 
 def era5ify_bbox(
@@ -741,6 +907,7 @@ def era5ify_bbox(
     resolution: float = 0.25,
     verbosity: int = 0,
     save_raw: bool = True,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Public function for querying data for a defined bounding box (north, south, east, west bounds).
@@ -760,6 +927,7 @@ def era5ify_bbox(
         resolution (float, optional): Spatial resolution in degrees (0.25, 0.1, 0.5, etc.). Defaults to 0.25, minimum is 0.1.
         verbosity (int, optional): Verbosity level (0 for no output, 1 for info output, 2 for debug/complete output). Defaults to 0.
         save_raw (bool, optional): Whether to save the raw data. Defaults to True.
+        max_workers (int, optional): Number of time chunks to download and process concurrently. Defaults to 1 (one chunk at a time).
 
     Returns:
         DataFrame: A DataFrame containing the processed data for the specified bbox.
@@ -780,10 +948,6 @@ def era5ify_bbox(
     if north <= south or east <= west:
         raise ValueError("Invalid bounding box coordinates")
 
-    # Create temporary GeoJSON
-    geojson_data = create_geojson_from_bbox(west, south, east, north)
-    temp_geojson_file = create_temp_geojson(geojson_data, request_id)
-
     try:
         params = ProcessingParams(
             request_id=request_id,
@@ -799,11 +963,12 @@ def era5ify_bbox(
             east=east,
             west=west,
             dist_features=None,
+            max_workers=max_workers,
         )
         return process_era5(params, save_raw)
 
     finally:
-        cleanup_temp_files(request_id, temp_geojson_file)
+        cleanup_temp_files(request_id)
 
 
 def era5ify_point(
@@ -818,6 +983,7 @@ def era5ify_point(
     frequency: str = "hourly",
     verbosity: int = 0,
     save_raw: bool = True,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Public function for querying data for a single geographical point (latitude, longitude).
@@ -834,6 +1000,7 @@ def era5ify_point(
         frequency (str, optional): Frequency of the data ('hourly', 'daily', 'weekly', 'monthly', 'yearly'). Defaults to 'hourly'.
         verbosity (int, optional): Verbosity level (0 for no output, 1 for info output, 2 for debug/complete output). Defaults to 0.
         save_raw (bool, optional): Whether to save the raw data. Defaults to True.
+        max_workers (int, optional): Number of time chunks to download and process concurrently. Defaults to 1 (one chunk at a time).
 
     Returns:
         DataFrame: A DataFrame containing the processed data for the specified point.
@@ -929,26 +1096,88 @@ def era5ify_point(
         ],
     }
 
-    # Create temporary GeoJSON file
-    temp_geojson_file = create_temp_geojson(geojson_data, f"{request_id}_point")
+    start_dt = parse_date(start_date)
+    end_dt = parse_date(end_date)
+
+    # Validate dataset type
+    dataset_type = dataset_type.lower()
+    if dataset_type not in ["single", "pressure"]:
+        raise ValueError(
+            f"Invalid dataset_type: {dataset_type}. Must be 'single' or 'pressure'"
+        )
 
     try:
-        # Call the existing geojson function with high resolution to get nearest point
-        return era5ify_geojson(
-            request_id=f"{request_id}",
+        # Hand the generated GeoJSON over in memory rather than writing it to a
+        # temporary file for era5ify_geojson to parse back. The high resolution
+        # picks up the nearest grid point.
+        params = ProcessingParams(
+            request_id=request_id,
             variables=variables,
-            start_date=start_date,
-            end_date=end_date,
-            json_file=temp_geojson_file,
-            dataset_type=dataset_type,
-            pressure_levels=pressure_levels,
+            start_date=start_dt,
+            end_date=end_dt,
             frequency=frequency,
             resolution=0.1,
-            verbosity=verbosity,
-            save_raw=save_raw,
+            dataset_type=dataset_type,
+            pressure_levels=pressure_levels if dataset_type == "pressure" else None,
+            geojson_data=geojson_data,
+            dist_features=None,
+            max_workers=max_workers,
         )
+        return process_era5(params, save_raw)
+
     finally:
-        pass
+        cleanup_temp_files(request_id)
+
+
+def _era5ify_dispatch(request: Dict[str, Any]) -> pd.DataFrame:
+    """Run the era5ify_* function matching the keys of one batched request"""
+    if "json_file" in request:
+        return era5ify_geojson(**request)
+    if "latitude" in request:
+        return era5ify_point(**request)
+    return era5ify_bbox(**request)
+
+
+def era5ify_many(
+    batch: List[Dict[str, Any]], max_workers: Optional[int] = None
+) -> List[pd.DataFrame]:
+    """
+    Public function for running several era5ify requests in parallel worker processes.
+
+    Each request is a dict of keyword arguments for era5ify_geojson (if it has
+    'json_file'), era5ify_point (if it has 'latitude') or era5ify_bbox. Every
+    worker loads its own inputs and downloads independently, so the requests
+    share no state. Temporary files are named after the request_id, so the
+    ids must be distinct.
+
+    Each worker can itself download up to its request's own max_workers time
+    chunks at once, so the number of simultaneous CDS requests is up to
+    max_workers times that. Keep both small to avoid being throttled by CDS.
+
+    Args:
+        batch (List[Dict[str, Any]]): Keyword arguments for each request.
+        max_workers (int | None, optional): Maximum number of worker processes. Defaults to min(len(batch), 2).
+
+    Returns:
+        List[DataFrame]: The processed data for each request, in the order given.
+    """
+    request_ids = [request["request_id"] for request in batch]
+    for request_id in request_ids:
+        clashes = [
+            other
+            for other in request_ids
+            if _owns_temp_name(other, request_id) or _owns_temp_name(request_id, other)
+        ]
+        if len(clashes) > 1:
+            raise ValueError(
+                f"request_id {request_id!r} clashes with another request in the batch"
+            )
+
+    if max_workers is None:
+        max_workers = max(1, min(len(batch), 2))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_era5ify_dispatch, batch))
 
 
 def parse_date(date_str: str) -> dt.datetime:
@@ -962,17 +1191,27 @@ def parse_date(date_str: str) -> dt.datetime:
         )
 
 
-def cleanup_temp_files(request_id: str, temp_geojson_file: str) -> None:
+def _owns_temp_name(request_id: str, name: str) -> bool:
+    """
+    Whether name is one of the downloads (request_id[_chunkN].zip/.nc) or
+    extraction directories (request_id[_chunkN]) a request leaves behind
+    """
+    return (
+        re.fullmatch(rf"{re.escape(request_id)}(_chunk\d+)?(\.zip|\.nc)?", name)
+        is not None
+    )
+
+
+def cleanup_temp_files(request_id: str) -> None:
     """Clean up temporary files"""
-    if os.path.exists(temp_geojson_file):
-        os.remove(temp_geojson_file)
-
-    temp_dir = tempfile.gettempdir()
-    for pattern in [f"*{request_id}*.zip", f"*{request_id}*.nc"]:
-        for file in glob.glob(os.path.join(temp_dir, pattern)):
-            if os.path.exists(file):
-                os.remove(file)
-
-    for item in glob.glob(os.path.join(temp_dir, f"*{request_id}*")):
-        if os.path.isdir(item):
-            shutil.rmtree(item)
+    # Only this request's own files are matched, so a concurrent request
+    # whose id merely contains this one keeps its downloads
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if not _owns_temp_name(request_id, entry.name):
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                elif entry.name.endswith((".zip", ".nc")):
+                    os.remove(entry.path)
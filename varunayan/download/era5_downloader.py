@@ -1,13 +1,21 @@
+import contextlib
 import datetime as dt
+import hashlib
+import json
 import logging
 import os
+import shutil
 import tempfile
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
 import cdsapi  # pyright: ignore
+import pandas as pd
 
 sup_log: bool = False
 
+# Environment variable naming a directory in which to keep finished downloads
+CACHE_DIR_ENV = "VARUNAYAN_CACHE_DIR"
+
 
 class BlockInfoFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
@@ -32,6 +40,57 @@ def set_v_downloader(verbosity: int) -> None:
         sup_log = True
 
 
+def _retrieve(dataset: str, request: Dict[str, Any], output_file: str) -> None:
+    """
+    Run a CDS retrieve into output_file. When VARUNAYAN_CACHE_DIR is set, the
+    download is kept there under a hash of the request and identical requests
+    are served from it without contacting CDS.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        client = cdsapi.Client()
+        client.retrieve(dataset, request, output_file)
+        return
+
+    key = hashlib.sha1(
+        json.dumps({"dataset": dataset, "request": request}, sort_keys=True).encode()
+    ).hexdigest()
+    cache_path = os.path.join(cache_dir, key + os.path.splitext(output_file)[1])
+
+    if not os.path.exists(cache_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Download next to the cache entry and move it into place only once
+        # complete, so an interrupted download is never served
+        fd, partial_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+        os.close(fd)
+        try:
+            client = cdsapi.Client()
+            client.retrieve(dataset, request, partial_path)
+            os.replace(partial_path, cache_path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial_path)
+
+    # The output file is deleted after processing, so hand out a link or copy
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(output_file)
+    try:
+        os.link(cache_path, output_file)
+    except OSError:
+        shutil.copyfile(cache_path, output_file)
+
+
+def _date_components(
+    start_date: dt.datetime, end_date: dt.datetime
+) -> Tuple[List[str], List[str], List[str]]:
+    """Distinct years, months and days (as zero-padded strings) in a date range."""
+    dates = pd.date_range(start_date.date(), end_date.date(), freq="D")
+    years = [str(y) for y in dates.year.unique().sort_values()]
+    months = [f"{m:02d}" for m in dates.month.unique().sort_values()]
+    days = [f"{d:02d}" for d in dates.day.unique().sort_values()]
+    return years, months, days
+
+
 def download_era5_single_lvl(
     request_id: str,
     variables: List[str],
@@ -53,29 +112,7 @@ def download_era5_single_lvl(
         else "reanalysis-era5-single-levels"
     )
 
-    # Prepare date ranges
-    dates: Dict[str, Dict[str, List[str]]] = {}
-    current_date = start_date
-    while current_date <= end_date:
-        year = str(current_date.year)
-        if year not in dates:
-            dates[year] = {}
-        month = str(current_date.month).zfill(2)
-        if month not in dates[year]:
-            dates[year][month] = []
-        dates[year][month].append(str(current_date.day).zfill(2))
-        current_date += dt.timedelta(days=1)
-
-    years: List[str] = list(dates.keys())
-    months: List[str] = []
-    days: List[str] = []
-    for year in dates:
-        for month in dates[year]:
-            if month not in months:
-                months.append(month)
-            for day in dates[year][month]:
-                if day not in days:
-                    days.append(day)
+    years, months, days = _date_components(start_date, end_date)
 
     # Save to temporary directory
     temp_dir = tempfile.gettempdir()
@@ -108,8 +145,7 @@ def download_era5_single_lvl(
             "grid": [resolution, resolution],
         }
 
-    client = cdsapi.Client()
-    client.retrieve(dataset, request, output_file)
+    _retrieve(dataset, request, output_file)
 
     return output_file
 
@@ -136,29 +172,7 @@ def download_era5_pressure_lvl(
         else "reanalysis-era5-pressure-levels"
     )
 
-    # Prepare date ranges
-    dates: Dict[str, Dict[str, List[str]]] = {}
-    current_date = start_date
-    while current_date <= end_date:
-        year = str(current_date.year)
-        if year not in dates:
-            dates[year] = {}
-        month = str(current_date.month).zfill(2)
-        if month not in dates[year]:
-            dates[year][month] = []
-        dates[year][month].append(str(current_date.day).zfill(2))
-        current_date += dt.timedelta(days=1)
-
-    years: List[str] = list(dates.keys())
-    months: List[str] = []
-    days: List[str] = []
-    for year in dates:
-        for month in dates[year]:
-            if month not in months:
-                months.append(month)
-            for day in dates[year][month]:
-                if day not in days:
-                    days.append(day)
+    years, months, days = _date_components(start_date, end_date)
 
     # Save to temporary directory
     temp_dir = tempfile.gettempdir()
@@ -191,7 +205,6 @@ def download_era5_pressure_lvl(
             "format": "netcdf",
         }
 
-    client = cdsapi.Client()
-    client.retrieve(dataset, request, output_file)
+    _retrieve(dataset, request, output_file)
 
     return output_file
@@ -1,6 +1,8 @@
 import logging
-from typing import Any, List, Optional
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..util.logging_utils import get_logger
@@ -8,6 +10,17 @@ from .variable_lists import exclude_cols, max_vars, min_vars, rate_vars, sum_var
 
 logger = get_logger(level=logging.DEBUG)
 
+# Aggregation category of every known variable name, listed in increasing
+# precedence: when a column matches several categories the later one wins
+_CATEGORY_ORDER = ("sum", "max", "min", "rate")
+_VAR_CATEGORY = {
+    name: category
+    for category, names in zip(
+        _CATEGORY_ORDER, (sum_vars, max_vars, min_vars, rate_vars)
+    )
+    for name in names
+}
+
 
 def set_v_data_agg(verbosity: int) -> None:
 
@@ -24,6 +37,87 @@ def set_v_data_agg(verbosity: int) -> None:
         logger.setLevel(logging.WARNING)
 
 
+def _calendar_parts(times: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Equivalent of (times.dt.date, times.dt.hour) that computes both fields
+    once per distinct timestamp rather than once per row (every grid point
+    repeats each time).
+    """
+    codes, unique_times = pd.factorize(times)
+    unique_index = pd.DatetimeIndex(unique_times)
+    # One extra slot so that missing values (code -1) map to NaT / NaN
+    dates = np.empty(len(unique_times) + 1, dtype=object)
+    dates[:-1] = unique_index.date
+    dates[-1] = pd.NaT
+    hours = unique_index.hour.to_numpy()
+    if (codes < 0).any():
+        hours = np.append(hours.astype(np.float64), np.nan)
+    return (
+        pd.Series(dates[codes], index=times.index),
+        pd.Series(hours[codes], index=times.index),
+    )
+
+
+def _column_categories(col: str) -> List[str]:
+    """
+    Aggregation categories of a column, in _CATEGORY_ORDER, matching either its
+    full lower-cased name or any "_"-separated token of it; empty for averaged
+    columns. A column in several categories is listed in each of them, so it
+    keeps the position of its first category in the output while the last one
+    decides how it is aggregated.
+    """
+    col = col.lower()
+    categories = {_VAR_CATEGORY.get(col)}
+    categories.update(_VAR_CATEGORY.get(token) for token in col.split("_"))
+    return [category for category in _CATEGORY_ORDER if category in categories]
+
+
+# Reducers for the reshaped (timestamps, points) arrays; NaNs are skipped
+# as in the pandas group engine
+_SPATIAL_REDUCERS: Dict[str, Callable[..., np.ndarray]] = {
+    "mean": np.nanmean,
+    "max": np.nanmax,
+    "min": np.nanmin,
+}
+
+
+def _spatial_aggregate(
+    df: pd.DataFrame, time_col: str, spec: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Aggregate across grid points for each timestamp, equivalent to
+    df.groupby(time_col, as_index=False).agg(spec). When every timestamp has
+    the same number of rows (the regular ERA5 layout), the values are
+    reshaped to (timestamps, points) and reduced along the points axis
+    instead of going through the group engine.
+    """
+    codes, times = pd.factorize(df[time_col], sort=True)
+    n_times = len(times)
+    regular = (
+        n_times > 0
+        and (codes >= 0).all()
+        and len(df) % n_times == 0
+        and all(how in _SPATIAL_REDUCERS for how in spec.values())
+        and all(isinstance(df[col].dtype, np.dtype) for col in spec)
+    )
+    if regular:
+        counts = np.bincount(codes, minlength=n_times)
+        regular = bool((counts == counts[0]).all())
+    if not regular:
+        return df.groupby([time_col], as_index=False).agg(spec)
+
+    order = np.argsort(codes, kind="stable")
+    result: Dict[str, Any] = {time_col: times}
+    with warnings.catch_warnings():
+        # All-NaN rows give NaN, as in the group engine, without warning
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for col, how in spec.items():
+            values = df[col].to_numpy()[order].reshape(n_times, -1)
+            result[col] = _SPATIAL_REDUCERS[how](values, axis=1)
+    spatial_agg: pd.DataFrame = pd.DataFrame(result)
+    return spatial_agg
+
+
 # pyright: reportUnknownMemberType=false
 def aggregate_by_frequency(
     df: pd.DataFrame,
@@ -74,8 +168,7 @@ def aggregate_by_frequency(
     if "valid_time" in df.columns:
         if not pd.api.types.is_datetime64_any_dtype(df["valid_time"]):
             df["valid_time"] = pd.to_datetime(df["valid_time"], errors="coerce")
-        df["date"] = df["valid_time"].dt.date
-        df["hour"] = df["valid_time"].dt.hour
+        df["date"], df["hour"] = _calendar_parts(df["valid_time"])
         time_col = "valid_time"
     else:
         # If no valid_time, assume date and time columns exist
@@ -103,39 +196,23 @@ def aggregate_by_frequency(
         col for col in df.columns if col not in exclude_cols and col != "feature"
     ]
 
-    # Match columns that should be summed (more flexible matching)
-    sum_cols: List[str] = []
-    for col in var_cols:
-        col_lower = col.lower()
-        if any(sv == col_lower or sv in col_lower.split("_") for sv in sum_vars):
-            sum_cols.append(col)
+    # Ensure dist_features is a list for safe concatenation
+    dist_features = dist_features if isinstance(dist_features, list) else []
 
-    # Match columns that should use max
+    # Classify every column in a single pass; average columns are those not
+    # covered by other aggregation methods
+    sum_cols: List[str] = []
     max_cols: List[str] = []
-    for col in var_cols:
-        col_lower = col.lower()
-        if any(mv == col_lower or mv in col_lower.split("_") for mv in max_vars):
-            max_cols.append(col)
-
-    # Match columns that should use min
     min_cols: List[str] = []
-    for col in var_cols:
-        col_lower = col.lower()
-        if any(mv == col_lower or mv in col_lower.split("_") for mv in min_vars):
-            min_cols.append(col)
-
-    # Match rate columns
     rate_cols: List[str] = []
+    avg_cols: List[str] = []
+    buckets = {"sum": sum_cols, "max": max_cols, "min": min_cols, "rate": rate_cols}
     for col in var_cols:
-        col_lower = col.lower()
-        if any(rv == col_lower or rv in col_lower.split("_") for rv in rate_vars):
-            rate_cols.append(col)
-
-    # Average columns are those not covered by other aggregation methods
-    # Ensure dist_features is a list for safe concatenation
-    dist_features = dist_features if isinstance(dist_features, list) else []
-    special_cols = sum_cols + max_cols + min_cols + rate_cols + dist_features
-    avg_cols = [col for col in var_cols if col not in special_cols]
+        categories = _column_categories(col)
+        for category in categories:
+            buckets[category].append(col)
+        if not categories and col not in dist_features:
+            avg_cols.append(col)
 
     logger.debug(f"Sum columns: {sum_cols}")
     logger.debug(f"Max columns: {max_cols}")
@@ -202,24 +279,20 @@ def _process_single_feature(
     """
     Helper function to process aggregation for a single feature or the entire dataset.
     """
+    # Spatial aggregation across points for each timestamp; even sum variables
+    # are averaged spatially, max/min variables take the extremes across points
+    spatial_spec = {
+        **{col: "mean" for col in avg_cols},
+        **{col: "mean" for col in sum_cols},
+        **{col: "max" for col in max_cols},
+        **{col: "min" for col in min_cols},
+        **{col: "mean" for col in rate_cols},
+    }
+
     # Return original data if hourly frequency requested
     if frequency == "hourly":
         # For hourly, just aggregate across spatial points for each hour
-        spatial_agg = df.groupby([time_col], as_index=False).agg(
-            {
-                **{col: "mean" for col in avg_cols},
-                **{col: "mean" for col in sum_cols},  # Sum vars are averaged spatially
-                **{
-                    col: "max" for col in max_cols
-                },  # Max vars take maximum across points
-                **{
-                    col: "min" for col in min_cols
-                },  # Min vars take minimum across points
-                **{
-                    col: "mean" for col in rate_cols
-                },  # Rate vars are averaged spatially
-            }
-        )
+        spatial_agg = _spatial_aggregate(df, time_col, spatial_spec)
 
         # Add standardized date columns for hourly frequency
         spatial_agg["date"] = spatial_agg[time_col].dt.date
@@ -249,46 +322,24 @@ def _process_single_feature(
 
     # Step 1: First spatial aggregation - aggregate across points for each timestamp
     # Different aggregation methods based on variable type
-    spatial_agg = df.groupby([time_col], as_index=False).agg(
-        {
-            **{col: "mean" for col in avg_cols},
-            **{col: "mean" for col in sum_cols},  # Even sum vars are averaged spatially
-            **{col: "max" for col in max_cols},  # Max vars take maximum across points
-            **{col: "min" for col in min_cols},  # Min vars take minimum across points
-            **{col: "mean" for col in rate_cols},  # Rate vars are averaged spatially
-        }
-    )
+    spatial_agg = _spatial_aggregate(df, time_col, spatial_spec)
 
     # Step 2: Temporal aggregation based on the specified frequency
     # Set the datetime as index for resampling
     spatial_agg = spatial_agg.set_index(time_col)
-    # Perform temporal aggregation
-    result = pd.DataFrame()
-
-    # For sum variables, sum over time periods
-    for col in sum_cols:
-        if col in spatial_agg.columns:
-            result[col] = spatial_agg[col].resample(freq_map[frequency]).sum()
-
-    # For max variables, take maximum over time periods
-    for col in max_cols:
-        if col in spatial_agg.columns:
-            result[col] = spatial_agg[col].resample(freq_map[frequency]).max()
-
-    # For min variables, take minimum over time periods
-    for col in min_cols:
-        if col in spatial_agg.columns:
-            result[col] = spatial_agg[col].resample(freq_map[frequency]).min()
-
-    # For rate variables, average over time periods (they're already rates)
-    for col in rate_cols:
-        if col in spatial_agg.columns:
-            result[col] = spatial_agg[col].resample(freq_map[frequency]).mean()
-
-    # For average variables, average over time periods
-    for col in avg_cols:
-        if col in spatial_agg.columns:
-            result[col] = spatial_agg[col].resample(freq_map[frequency]).mean()
+    # Perform temporal aggregation in a single resample pass: sum variables
+    # are summed over time periods, max/min variables take the extremes, and
+    # rate and average variables are averaged (rates are already rates)
+    temporal_spec = {
+        **{col: "sum" for col in sum_cols},
+        **{col: "max" for col in max_cols},
+        **{col: "min" for col in min_cols},
+        **{col: "mean" for col in rate_cols},
+        **{col: "mean" for col in avg_cols},
+    }
+    result = spatial_agg.resample(freq_map[frequency]).agg(
+        {col: how for col, how in temporal_spec.items() if col in spatial_agg.columns}
+    )
 
     # Reset index to get the datetime as a column
     result = result.reset_index()
@@ -468,11 +519,12 @@ def _process_pressure_levels_single_feature(
 
     # For other frequencies, first spatial then temporal aggregation
 
-    # 1. Spatial aggregation - average across lat/lon points
-    spatial_agg = df.groupby(group_cols, as_index=False)[var_cols].mean()
+    # 1. Spatial aggregation - average across lat/lon points. The groups are
+    # left unsorted since the resample below bins by time on its own
+    spatial_agg = df.groupby(group_cols, as_index=False, sort=False)[var_cols].mean()
 
     # 2. Temporal aggregation
-    freq_map = {"daily": "D", "weekly": "W", "monthly": "MS", "yearly": "AS"}
+    freq_map = {"daily": "D", "weekly": "W", "monthly": "MS", "yearly": "YS"}
 
     if frequency not in freq_map:
         raise ValueError(f"Invalid frequency: {frequency}")
@@ -480,33 +532,19 @@ def _process_pressure_levels_single_feature(
     # Set time as index for resampling
     temporal_agg = spatial_agg.set_index(time_col)
 
-    # For pressure levels, we need to group by pressure level before resampling
+    # For pressure levels, resample every level in one grouped call. This
+    # yields the same rows (including empty periods) as resampling each level
+    # on its own, with the levels kept in their order of appearance in df
     if has_pressure_level:
-        # Get unique pressure levels
-        pressure_levels_array = df["pressure_level"].dropna().unique()
-        pressure_levels: List[Any] = (
-            pressure_levels_array.tolist()
-            if hasattr(pressure_levels_array, "tolist")
-            else list(pressure_levels_array)
+        pressure_levels = df["pressure_level"].dropna().unique()
+        result_df: pd.DataFrame = (
+            temporal_agg.groupby("pressure_level", sort=False)[var_cols]
+            .resample(freq_map[frequency])
+            .mean()
+            .reindex(pressure_levels, level="pressure_level")
+            .reset_index()
         )
-
-        level_frames: List[pd.DataFrame] = []
-
-        # Process each pressure level separately
-        for level in pressure_levels:
-            # Filter data for this pressure level
-            level_data = temporal_agg[temporal_agg["pressure_level"] == level]
-
-            # Resample and average variables
-            resampled = (
-                level_data[var_cols].resample(freq_map[frequency]).mean().reset_index()
-            )
-
-            # Add pressure level back
-            resampled["pressure_level"] = level
-            level_frames.append(resampled)
-
-        result_df = pd.concat(level_frames, ignore_index=True)
+        result_df = result_df[[time_col, *var_cols, "pressure_level"]]
     else:
         # No pressure levels - simple resample
         result_df = (
@@ -1,16 +1,28 @@
 import datetime as dt
 import logging
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-import geopandas as gpd
 import numpy as np
 import pandas as pd
-import xarray as xr
-from shapely.geometry import Point
+import shapely
 from shapely.geometry.base import BaseGeometry
 
 from ..util.logging_utils import get_logger
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+    import xarray as xr
+
 logger = get_logger(level=logging.DEBUG)
 
 
@@ -29,10 +41,91 @@ def set_v_data_fil(verbosity: int) -> None:
         logger.setLevel(logging.WARNING)
 
 
+def _grid_points(lons: np.ndarray, lats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flat longitude and latitude arrays covering every distinct grid point.
+    Duplicates are dropped on the 1-D axes, which keeps the first-seen order
+    and avoids de-duplicating the full grid.
+    """
+    lon_grid, lat_grid = np.meshgrid(pd.unique(lons), pd.unique(lats))
+    return lon_grid.ravel(), lat_grid.ravel()
+
+
+def _points_in_geometry(
+    geom: BaseGeometry, lons: np.ndarray, lats: np.ndarray
+) -> np.ndarray:
+    """
+    Boolean mask of the points lying inside or on the boundary of geom.
+    Points outside the geometry's bounding box are rejected with plain array
+    comparisons, so only the remaining candidates go through GEOS.
+    """
+    minx, miny, maxx, maxy = geom.bounds
+    mask: np.ndarray = (lons >= minx) & (lons <= maxx) & (lats >= miny) & (lats <= maxy)
+    if mask.any():
+        shapely.prepare(geom)
+        mask[mask] = shapely.intersects_xy(geom, lons[mask], lats[mask])
+    return mask
+
+
+def _point_locator(
+    lons: np.ndarray, lats: np.ndarray, num_features: int
+) -> Callable[[BaseGeometry], np.ndarray]:
+    """
+    Function returning the indices of the points inside or on a geometry.
+    With several features the points are indexed once in an STRtree, so each
+    feature only visits the points near it instead of rescanning all of them.
+    """
+    if num_features <= 1:
+        return lambda geom: np.flatnonzero(_points_in_geometry(geom, lons, lats))
+    tree = shapely.STRtree(shapely.points(lons, lats))
+    return lambda geom: np.sort(tree.query(geom, predicate="intersects"))
+
+
+def _matched_cells_frame(
+    ds: "xr.Dataset", matched: pd.DataFrame, lat_coord: str, lon_coord: str
+) -> pd.DataFrame:
+    """
+    ds.to_dataframe().reset_index() restricted to the matched grid cells.
+    On a regular grid the cells are picked pointwise, so cells that share a
+    row or column with a matched point but lie outside every feature are
+    never materialized. Columns come out in the same order as converting the
+    full dataset would give.
+    """
+    import xarray as xr
+
+    lat_index = pd.Index(np.asarray(ds.coords[lat_coord].values))
+    lon_index = pd.Index(np.asarray(ds.coords[lon_coord].values))
+    if not (
+        lat_coord in ds.dims
+        and lon_coord in ds.dims
+        and lat_index.is_unique
+        and lon_index.is_unique
+    ):
+        full: pd.DataFrame = ds.to_dataframe().reset_index()
+        return full
+
+    points = matched[["latitude", "longitude"]].drop_duplicates()
+    cell_dim = "_matched_cell"
+    cells = ds.isel(
+        {
+            lat_coord: xr.DataArray(
+                lat_index.get_indexer(points["latitude"]), dims=cell_dim
+            ),
+            lon_coord: xr.DataArray(
+                lon_index.get_indexer(points["longitude"]), dims=cell_dim
+            ),
+        }
+    )
+    df: pd.DataFrame = cells.to_dataframe().reset_index().drop(columns=cell_dim)
+    dim_cols = [str(d) for d in ds.dims if str(d) in df.columns]
+    ordered: pd.DataFrame = df[dim_cols + [c for c in df.columns if c not in dim_cols]]
+    return ordered
+
+
 # pyright: reportUnknownMemberType=false
 def filter_netcdf_by_shapefile(
-    ds: xr.Dataset,
-    geojson_data: Union[Dict[str, Any], gpd.GeoDataFrame],
+    ds: "xr.Dataset",
+    geojson_data: Union[Dict[str, Any], "gpd.GeoDataFrame"],
     dist_features: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """
@@ -50,6 +143,7 @@ def filter_netcdf_by_shapefile(
     """
     import warnings
 
+    import geopandas as gpd
     from shapely.validation import make_valid
 
     logger.info("Starting filtering process...")
@@ -91,21 +185,13 @@ def filter_netcdf_by_shapefile(
     lats = np.asarray(ds.coords[lat_coord].values)
     lons = np.asarray(ds.coords[lon_coord].values)
 
-    lon_grid, lat_grid = np.meshgrid(lons, lats)
-    unique_coords = pd.DataFrame(
-        {"latitude": lat_grid.flatten(), "longitude": lon_grid.flatten()}
-    ).drop_duplicates()
+    # Points are tested straight from the coordinate arrays, without building
+    # a shapely Point or a DataFrame row per grid cell
+    point_lons, point_lats = _grid_points(lons, lats)
 
-    total_points = len(unique_coords)
+    total_points = len(point_lons)
     logger.info(f"✓ Found {total_points} unique lat/lon combinations")
 
-    # Add geometry column
-    unique_coords["geometry"] = [
-        Point(lon, lat)
-        for lon, lat in zip(unique_coords["longitude"], unique_coords["latitude"])
-    ]
-    gdf_points = gpd.GeoDataFrame(unique_coords, geometry="geometry", crs="EPSG:4326")
-
     # Step 1.5: Comprehensive geometry validation and repair
     logger.info("→ Validating and repairing geometries...")
 
@@ -172,7 +258,8 @@ def filter_netcdf_by_shapefile(
     # Step 2: Filtering with error handling and feature identification
     logger.info("→ Filtering coordinates by feature geometries...")
     filter_start = dt.datetime.now()
-    matched_list: List[gpd.GeoDataFrame] = []
+    matched_list: List[pd.DataFrame] = []
+    locate_points = _point_locator(point_lons, point_lats, len(gdf))
 
     for idx, feature in gdf.iterrows():
         try:
@@ -186,7 +273,10 @@ def filter_netcdf_by_shapefile(
             # Perform intersection with error handling
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", category=RuntimeWarning)
-                points_in_geom = gdf_points[gdf_points.geometry.intersects(geom)].copy()
+                inside = locate_points(geom)
+                points_in_geom = pd.DataFrame(
+                    {"latitude": point_lats[inside], "longitude": point_lons[inside]}
+                )
 
             if not points_in_geom.empty:
                 # Create composite feature identifier from multiple attributes
@@ -234,15 +324,11 @@ def filter_netcdf_by_shapefile(
         # (don't drop duplicates based on lat/lon since we want feature info)
         logger.info(f"✓ Found points in {len(matched_list)} features")
     else:
-        # Create empty GeoDataFrame with same structure
-        base_columns = list(gdf_points.columns) + ["feature"]
+        # Create empty DataFrame with same structure
+        base_columns = ["latitude", "longitude", "feature"]
         if dist_features:
             base_columns.extend(dist_features)
-        matched = gpd.GeoDataFrame(
-            columns=base_columns,
-            geometry="geometry",
-            crs="EPSG:4326",
-        )
+        matched = pd.DataFrame(columns=base_columns)
     filter_time = dt.datetime.now() - filter_start
 
     logger.info(
@@ -253,8 +339,9 @@ def filter_netcdf_by_shapefile(
     if matched.empty:
         raise ValueError("No points found inside any features in the GeoJSON.")
 
-    # Step 3: Join with original dataset
-    df = ds.to_dataframe().reset_index()
+    # Step 3: Join with original dataset, converting only the grid cells that
+    # hold matched points rather than the whole dataset
+    df = _matched_cells_frame(ds, matched, lat_coord, lon_coord)
     lat_col = "latitude" if "latitude" in df.columns else "lat"
     lon_col = "longitude" if "longitude" in df.columns else "lon"
 
@@ -284,13 +371,15 @@ def filter_netcdf_by_shapefile(
     logger.info("✓ Merge complete")
     logger.info(f"→ Final dataset shape: {final_df.shape}")
 
-    # Log some info about the composite keys if used
-    if dist_features and not final_df.empty:
-        unique_composites = final_df["feature"].nunique()
-        logger.info(f"✓ Found {unique_composites} unique composite feature identifiers")
-        logger.debug(
-            f"Sample composite keys: {final_df['feature'].unique()[:5].tolist()}"
+    # Log some info about the composite keys if used. Every matched point
+    # survives the merge, so the keys are read from the (much smaller) matched
+    # points rather than the merged rows, and only when they will be shown
+    if dist_features and not final_df.empty and logger.isEnabledFor(logging.INFO):
+        composite_keys = matched["feature"].unique()
+        logger.info(
+            f"✓ Found {len(composite_keys)} unique composite feature identifiers"
         )
+        logger.debug(f"Sample composite keys: {composite_keys[:5].tolist()}")
 
     logger.info(
         f"✓ Total processing time: {(dt.datetime.now() - start_time).total_seconds():.2f} seconds"
@@ -300,12 +389,14 @@ def filter_netcdf_by_shapefile(
 
 
 def get_unique_coordinates_in_polygon(
-    ds: xr.Dataset, geojson_data: Union[Dict[str, Any], gpd.GeoDataFrame]
+    ds: "xr.Dataset", geojson_data: Union[Dict[str, Any], "gpd.GeoDataFrame"]
 ) -> pd.DataFrame:
     """
     Alternative helper function that returns just the unique lat/lon pairs inside the polygon.
     This can be useful for other operations or caching coordinate filtering results.
     """
+    import geopandas as gpd
+
     logger.debug("Extracting unique coordinates inside polygon...")
 
     # Convert GeoJSON to GeoDataFrame
@@ -319,27 +410,21 @@ def get_unique_coordinates_in_polygon(
     if gdf.crs is None:
         gdf.crs = "EPSG:4326"
 
-    unified_polygon = gdf.geometry.union_all()
-
     # Get coordinate arrays
     lat_coord = "latitude" if "latitude" in ds.coords else "lat"
     lon_coord = "longitude" if "longitude" in ds.coords else "lon"
     lats = np.asarray(ds.coords[lat_coord].values)
     lons = np.asarray(ds.coords[lon_coord].values)
 
-    # Create grid and unique combinations
-    lon_grid, lat_grid = np.meshgrid(lons, lats)
-    unique_coords = pd.DataFrame(
-        {"latitude": lat_grid.flatten(), "longitude": lon_grid.flatten()}
-    ).drop_duplicates()
-
-    # Filter coordinates
-    unique_coords["geometry"] = [
-        Point(lon, lat)
-        for lon, lat in zip(unique_coords["longitude"], unique_coords["latitude"])
-    ]
-    gdf_points = gpd.GeoDataFrame(unique_coords, geometry="geometry", crs="EPSG:4326")
-    inside_coords = gdf_points[gdf_points.geometry.intersects(unified_polygon)]
-
-    subset = inside_coords[["latitude", "longitude"]].copy()
-    return pd.DataFrame(subset)
+    # Create grid and filter coordinates. A point intersects the union of the
+    # features exactly when it intersects one of them, so the per-feature hits
+    # are combined instead of computing the (costly) topological union.
+    point_lons, point_lats = _grid_points(lons, lats)
+    locate_points = _point_locator(point_lons, point_lats, len(gdf))
+    inside = np.zeros(len(point_lons), dtype=bool)
+    for geom in gdf.geometry:
+        if geom is not None and not geom.is_empty:
+            inside[locate_points(geom)] = True
+    return pd.DataFrame(
+        {"latitude": point_lats[inside], "longitude": point_lons[inside]}
+    )
@@ -34,8 +34,14 @@ def extract_download(
         extract_dir: Directory to extract to (optional)
 
     Returns:
-        List of extracted file paths
+        List of extracted file paths (the input path itself for a NetCDF file)
     """
+    # A single NetCDF file is read where it is; copying it would only
+    # duplicate the download on disk
+    if zip_or_file_path.lower().endswith(".nc"):
+        logger.info(f"Using NetCDF file: {zip_or_file_path}")
+        return [zip_or_file_path]
+
     # If no extract directory specified, create one based on filename
     if extract_dir is None:
         filename = os.path.basename(zip_or_file_path)
@@ -50,31 +56,23 @@ def extract_download(
 
     # Determine file type
     if zip_or_file_path.lower().endswith(".zip"):
-        # Zip file extraction
+        # Zip file extraction; only the NetCDF members are used downstream
         logger.info(f"Extracting zip file: {zip_or_file_path}")
         with zipfile.ZipFile(zip_or_file_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
-            extracted_files = zip_ref.namelist()
-            extracted_files = [os.path.join(extract_dir, f) for f in extracted_files]
-    elif zip_or_file_path.lower().endswith(".nc"):
-        # Single NetCDF file - just copy to extraction directory
-        logger.info(f"Copying NetCDF file: {zip_or_file_path}")
-        import shutil
-
-        dest_path = os.path.join(extract_dir, os.path.basename(zip_or_file_path))
-        shutil.copy(zip_or_file_path, dest_path)
-        extracted_files = [dest_path]
+            members = zip_ref.namelist()
+            nc_members = [m for m in members if m.lower().endswith(".nc")]
+            if not nc_members:
+                zip_ref.extractall(extract_dir)
+                extracted_files = [os.path.join(extract_dir, m) for m in members]
+                logger.warning(f"Warning: No NetCDF files found in {zip_or_file_path}")
+                logger.warning(f"Found files: {', '.join(extracted_files)}")
+                return extracted_files
+
+            zip_ref.extractall(extract_dir, members=nc_members)
+            nc_files = [os.path.join(extract_dir, m) for m in nc_members]
     else:
         raise ValueError(f"Unsupported file type: {zip_or_file_path}")
 
-    # Find all NetCDF files in the extracted directory
-    nc_files = find_netcdf_files(extract_dir)
-
-    if not nc_files:
-        logger.warning(f"Warning: No NetCDF files found in {zip_or_file_path}")
-        logger.warning(f"Found files: {', '.join(extracted_files)}")
-        return extracted_files
-
     logger.info("Extracted NetCDF files:")
     for file in nc_files:
         logger.info(f"  - {file}")
@@ -6,6 +6,7 @@ from .geojson_utils import (
     get_bounding_box,
     is_valid_geojson,
     load_json_with_encoding,
+    read_bbox_only_json,
     set_v_geoj_utl,
 )
 from .logging_utils import Colors, get_logger
@@ -14,6 +15,7 @@ __all__ = [
     "extract_coords_from_geometry",
     "get_bounding_box",
     "load_json_with_encoding",
+    "read_bbox_only_json",
     "is_valid_geojson",
     "convert_to_geojson",
     "create_geojson_from_bbox",
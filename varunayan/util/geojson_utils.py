@@ -1,15 +1,48 @@
 import json
 import logging
 import os
+import re
 import tempfile
-from typing import Any, Dict, List, Tuple
+import warnings
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import requests
 
 from .logging_utils import get_logger
 
 logger = get_logger(level=logging.DEBUG)
 
+JSON_ENCODINGS = ("utf-8", "utf-16", "latin-1", "cp1252")
+
+# Files below this size are checked for the bare {"bbox": [w, s, e, n]} form
+BBOX_ONLY_MAX_BYTES = 512
+_NUM = rb"\s*(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)\s*"
+_BBOX_ONLY_RE = re.compile(
+    rb'\s*\{\s*"bbox"\s*:\s*\[' + rb",".join([_NUM] * 4) + rb"\]\s*\}\s*"
+)
+
+# Geometry types that carry their data under "coordinates"
+_GEOM_TYPES = frozenset(
+    {
+        "Point",
+        "MultiPoint",
+        "LineString",
+        "MultiLineString",
+        "Polygon",
+        "MultiPolygon",
+    }
+)
+# Container types and the member each one must hold
+_TYPE_CHECKS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    "FeatureCollection": lambda d: isinstance(d.get("features"), list),
+    "Feature": lambda d: isinstance(d.get("geometry"), dict),
+    "GeometryCollection": lambda d: isinstance(d.get("geometries"), list),
+}
+
+# Keys naming explicit lat/lon boundaries, matched case-insensitively
+_BOUND_KEYS = frozenset({"north", "south", "east", "west"})
+
 
 def set_v_geoj_utl(verbosity: int) -> None:
 
@@ -50,6 +83,56 @@ def extract_coords_from_geometry(geometry: Dict[str, Any]) -> List[List[float]]:
     return coords
 
 
+def _positions_array(positions: Any) -> Optional[np.ndarray]:
+    """Convert a list of GeoJSON positions to an (n, 2) lon/lat array."""
+    coords = np.asarray(positions, dtype=np.float64)
+    if coords.ndim != 2 or len(coords) == 0:
+        return None
+    return coords[:, :2]
+
+
+def _geometry_coord_arrays(geometry: Dict[str, Any]) -> Iterator[np.ndarray]:
+    """Yield the coordinates of a GeoJSON geometry as (n, 2) arrays, one per ring."""
+    geom_type = geometry["type"]
+
+    if geom_type == "Point":
+        position_lists = [[geometry["coordinates"]]]
+    elif geom_type == "MultiPoint" or geom_type == "LineString":
+        position_lists = [geometry["coordinates"]]
+    elif geom_type == "MultiLineString" or geom_type == "Polygon":
+        position_lists = geometry["coordinates"]
+    elif geom_type == "MultiPolygon":
+        position_lists = [
+            line for polygon in geometry["coordinates"] for line in polygon
+        ]
+    elif geom_type == "GeometryCollection":
+        for geom in geometry["geometries"]:
+            yield from _geometry_coord_arrays(geom)
+        return
+    else:
+        return
+
+    for positions in position_lists:
+        coords = _positions_array(positions)
+        if coords is not None:
+            yield coords
+
+
+def _coord_arrays(geometry: Dict[str, Any]) -> List[np.ndarray]:
+    """
+    The (n, 2) lon/lat coordinate arrays of a geometry. Rings mixing 2-D and
+    3-D positions cannot be read as one array, so such geometries fall back
+    to reading their positions one by one.
+    """
+    try:
+        return list(_geometry_coord_arrays(geometry))
+    except ValueError:
+        coords = extract_coords_from_geometry(geometry)
+        if not coords:
+            return []
+        return [np.array([coord[:2] for coord in coords], dtype=np.float64)]
+
+
 def get_bounding_box(geojson_data: Dict[str, Any]) -> Tuple[float, float, float, float]:
     """
     Extract the bounding box (west, south, east, north) from a GeoJSON object.
@@ -67,31 +150,69 @@ def get_bounding_box(geojson_data: Dict[str, Any]) -> Tuple[float, float, float,
         return (bbox[0], bbox[1], bbox[2], bbox[3])
 
     # If no bbox, calculate it ourselves
-    all_coords: List[List[float]] = []
-
     if geojson_data["type"] == "Feature":
-        all_coords.extend(extract_coords_from_geometry(geojson_data["geometry"]))
+        coord_arrays = _coord_arrays(geojson_data["geometry"])
     elif geojson_data["type"] == "FeatureCollection":
-        for feature in geojson_data["features"]:
-            all_coords.extend(extract_coords_from_geometry(feature["geometry"]))
+        coord_arrays = [
+            coords
+            for feature in geojson_data["features"]
+            for coords in _coord_arrays(feature["geometry"])
+        ]
     else:
         # Assume it's a geometry object
-        all_coords.extend(extract_coords_from_geometry(geojson_data))
+        coord_arrays = _coord_arrays(geojson_data)
 
-    if not all_coords:
+    if not coord_arrays:
         raise ValueError("No coordinates found in the GeoJSON data")
 
-    # Extract longitudes (x) and latitudes (y) - IMPORTANT: GeoJSON stores
-    # [lon, lat]
-    lons: List[float] = [coord[0] for coord in all_coords]  # Longitude is first
-    lats: List[float] = [coord[1] for coord in all_coords]  # Latitude is second
+    # IMPORTANT: GeoJSON stores [lon, lat], so column 0 is longitude
+    all_coords = np.concatenate(coord_arrays, axis=0)
+    west, south = (float(v) for v in all_coords.min(axis=0))
+    east, north = (float(v) for v in all_coords.max(axis=0))
+
+    return (west, south, east, north)
+
+
+def _parse_json_bytes(raw_content: bytes) -> Optional[Dict[str, Any]]:
+    """Decode raw bytes with each supported encoding until one parses as a JSON object."""
+    for encoding in JSON_ENCODINGS:
+        try:
+            content = raw_content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            logging.debug(f"Successfully loaded JSON with {encoding} encoding")
+            return parsed
+    return None
 
-    # Calculate bounds
-    west: float = min(lons)
-    east: float = max(lons)
-    south: float = min(lats)
-    north: float = max(lats)
 
+def read_bbox_only_json(file_path: str) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Read a tiny JSON file of the form {"bbox": [west, south, east, north]}
+    without going through the JSON parser.
+
+    Args:
+        file_path: Path to a local JSON file
+
+    Returns:
+        Tuple of (west, south, east, north), or None if the file is larger than
+        BBOX_ONLY_MAX_BYTES or holds anything other than a bare bbox
+    """
+    try:
+        if os.path.getsize(file_path) > BBOX_ONLY_MAX_BYTES:
+            return None
+        with open(file_path, "rb") as f:
+            match = _BBOX_ONLY_RE.fullmatch(f.read())
+    except OSError:
+        return None
+
+    if match is None:
+        return None
+    west, south, east, north = (float(v) for v in match.groups())
     return (west, south, east, north)
 
 
@@ -108,45 +229,25 @@ def load_json_with_encoding(file_path: str) -> Dict[str, Any]:
     Raises:
         ValueError: If the file cannot be parsed as JSON
     """
-    encodings = ["utf-8", "utf-16", "latin-1", "cp1252"]
+    parsed: Optional[Dict[str, Any]] = None
 
     if file_path.startswith("http://") or file_path.startswith("https://"):
         try:
             response = requests.get(file_path, timeout=10)
             response.raise_for_status()
-            raw_content = response.content  # Cache the response content
-            for encoding in encodings:
-                try:
-                    content = raw_content.decode(encoding)
-                except UnicodeDecodeError:
-                    continue
-                try:
-                    parsed = json.loads(content)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(parsed, dict):
-                    logging.debug(
-                        f"Successfully loaded JSON from URL with {encoding} encoding"
-                    )
-                    return parsed
+            parsed = _parse_json_bytes(response.content)
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Network error while fetching JSON from URL: {e}")
     else:
-        for encoding in encodings:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    parsed = json.load(f)
-                if isinstance(parsed, dict):
-                    logging.debug(
-                        f"Successfully loaded JSON file with {encoding} encoding"
-                    )
-                    return parsed
-            except UnicodeDecodeError:
-                continue
-            except json.JSONDecodeError:
-                continue
-            except Exception:
-                continue
+        # Read the file once and retry decoding in memory
+        try:
+            with open(file_path, "rb") as f:
+                parsed = _parse_json_bytes(f.read())
+        except OSError:
+            parsed = None
+
+    if parsed is not None:
+        return parsed
 
     raise ValueError(
         f"Could not load JSON from {file_path} with any supported encoding"
@@ -168,48 +269,17 @@ def is_valid_geojson(json_data: Dict[str, Any]) -> bool:
         return False
 
     # Basic GeoJSON structure check
-    if "type" not in json_data:
-        return False
-
-    # Valid GeoJSON types
-    valid_types = [
-        "FeatureCollection",
-        "Feature",
-        "Point",
-        "MultiPoint",
-        "LineString",
-        "MultiLineString",
-        "Polygon",
-        "MultiPolygon",
-        "GeometryCollection",
-    ]
-
-    if json_data["type"] not in valid_types:
+    geojson_type = json_data.get("type")
+    if not isinstance(geojson_type, str):
         return False
 
     # More specific checks based on type
-    if json_data["type"] == "FeatureCollection":
-        return "features" in json_data and isinstance(json_data["features"], list)
-
-    elif json_data["type"] == "Feature":
-        return "geometry" in json_data and isinstance(json_data["geometry"], dict)
+    type_check = _TYPE_CHECKS.get(geojson_type)
+    if type_check is not None:
+        return type_check(json_data)
 
     # For geometry types, check for coordinates
-    elif json_data["type"] in [
-        "Point",
-        "MultiPoint",
-        "LineString",
-        "MultiLineString",
-        "Polygon",
-        "MultiPolygon",
-    ]:
-        return "coordinates" in json_data
-
-    # For GeometryCollection
-    elif json_data["type"] == "GeometryCollection":
-        return "geometries" in json_data and isinstance(json_data["geometries"], list)
-
-    return False
+    return geojson_type in _GEOM_TYPES and "coordinates" in json_data
 
 
 def convert_to_geojson(json_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -229,27 +299,28 @@ def convert_to_geojson(json_data: Dict[str, Any]) -> Dict[str, Any]:
         ValueError: If the JSON cannot be converted to GeoJSON
     """
     # Case 1: It's already GeoJSON but failed validation due to minor issues
-    if "type" in json_data:
-        if json_data["type"] in ["Feature", "FeatureCollection"]:
-            # Try to fix common issues
-            if json_data["type"] == "FeatureCollection" and "features" not in json_data:
-                json_data["features"] = []
-
-            if json_data["type"] == "Feature" and "geometry" not in json_data:
-                raise ValueError(
-                    "Feature missing geometry and cannot be automatically fixed"
-                )
-
-            return json_data
+    geojson_type = json_data.get("type")
+    if geojson_type == "FeatureCollection":
+        # Try to fix common issues
+        json_data.setdefault("features", [])
+        return json_data
+
+    if geojson_type == "Feature":
+        if "geometry" not in json_data:
+            raise ValueError(
+                "Feature missing geometry and cannot be automatically fixed"
+            )
+        return json_data
 
     # Case 2: It contains coordinates or a bounding box directly
-    if "coordinates" in json_data:
+    coordinates = json_data.get("coordinates")
+    if coordinates is not None:
         # Assume it's meant to be a Polygon
         return {
             "type": "Feature",
             "geometry": {
                 "type": "Polygon",
-                "coordinates": json_data["coordinates"],
+                "coordinates": coordinates,
             },
             "properties": {},
         }
@@ -257,22 +328,25 @@ def convert_to_geojson(json_data: Dict[str, Any]) -> Dict[str, Any]:
     # Case 3: It contains a bounding box specified as
     # [west, south, east, north]
     bbox_value = json_data.get("bbox")
-    if isinstance(bbox_value, list) and len(bbox_value) >= 4:
-        west: float = float(bbox_value[0])
-        south: float = float(bbox_value[1])
-        east: float = float(bbox_value[2])
-        north: float = float(bbox_value[3])
-        return create_geojson_from_bbox(west, south, east, north)
+    if bbox_value is not None and not isinstance(bbox_value, str):
+        # Any indexable sequence of four or more numbers is accepted
+        try:
+            west: float = float(bbox_value[0])
+            south: float = float(bbox_value[1])
+            east: float = float(bbox_value[2])
+            north: float = float(bbox_value[3])
+        except (TypeError, ValueError, LookupError):
+            pass
+        else:
+            return create_geojson_from_bbox(west, south, east, north)
 
     # Case 4: It contains explicit lat/lon boundaries
-    keys = [k.lower() for k in json_data.keys()]
-    if all(k in keys for k in ["north", "south", "east", "west"]):
-        idx = {k: keys.index(k) for k in ["north", "south", "east", "west"]}
-        actual_keys = list(json_data.keys())
-        north = json_data[actual_keys[idx["north"]]]
-        south = json_data[actual_keys[idx["south"]]]
-        east = json_data[actual_keys[idx["east"]]]
-        west = json_data[actual_keys[idx["west"]]]
+    lower_map = {k.lower(): k for k in json_data}
+    if _BOUND_KEYS <= lower_map.keys():
+        north = json_data[lower_map["north"]]
+        south = json_data[lower_map["south"]]
+        east = json_data[lower_map["east"]]
+        west = json_data[lower_map["west"]]
         return create_geojson_from_bbox(west, south, east, north)
 
     # If we've gotten here, we can't automatically convert it
@@ -280,7 +354,7 @@ def convert_to_geojson(json_data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def create_geojson_from_bbox(
-    west: float, south: float, east: float, north: float
+    west: float, south: float, east: float, north: float, describe: bool = True
 ) -> Dict[str, Any]:
     """
     Create a GeoJSON polygon from bounding box coordinates.
@@ -290,6 +364,7 @@ def create_geojson_from_bbox(
         south: Southern latitude
         east: Eastern longitude
         north: Northern latitude
+        describe: Whether to add a human-readable "description" property
 
     Returns:
         A GeoJSON Feature with a Polygon geometry
@@ -305,12 +380,16 @@ def create_geojson_from_bbox(
         ]
     ]
 
+    properties: Dict[str, Any] = {}
+    if describe:
+        properties["description"] = (
+            f"Bounding box: N:{north}, W:{west}, S:{south}, E:{east}"
+        )
+
     return {
         "type": "Feature",
         "geometry": {"type": "Polygon", "coordinates": coordinates},
-        "properties": {
-            "description": (f"Bounding box: N:{north}, W:{west}, S:{south}, E:{east}")
-        },
+        "properties": properties,
     }
 
 
@@ -318,17 +397,39 @@ def create_temp_geojson(geojson_data: Dict[str, Any], request_id: str) -> str:
     """
     Create a temporary GeoJSON file with the provided data.
 
+    Deprecated: the era5ify_* functions pass GeoJSON data in memory and no
+    longer use this helper. It will be removed in a future release.
+
     Args:
         geojson_data: Valid GeoJSON data
         request_id: Unique identifier for the request (used in filename)
 
     Returns:
         Path to the created temporary file
-    """
-    temp_dir = tempfile.gettempdir()
-    output_path = os.path.join(temp_dir, f"{request_id}_temp_geojson.json")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geojson_data, f, indent=2)
+    Raises:
+        ValueError: If request_id contains a path separator
+    """
+    warnings.warn(
+        "create_temp_geojson is deprecated and will be removed in a future release",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    if os.sep in request_id or (os.altsep and os.altsep in request_id):
+        raise ValueError(f"request_id must not contain path separators: {request_id}")
+
+    # A unique name avoids collisions between runs sharing a request_id; the
+    # caller is responsible for removing the file
+    fd, output_path = tempfile.mkstemp(suffix=f"_{request_id}_temp_geojson.json")
+    try:
+        # Serialise compactly and write the encoded bytes straight to the
+        # descriptor, looping because os.write may write only part of them
+        payload = memoryview(
+            json.dumps(geojson_data, separators=(",", ":")).encode("utf-8")
+        )
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
 
     return output_path